@@ -1,60 +1,114 @@
-"""Recall App package for macOS menu bar application."""
+"""Recall App package for macOS menu bar application.
 
-from recall.app.bundle import (
-    AppConfig,
-    DownloadProgressEvent,
-    FirstRunSetup,
-    ModelInfo,
-    ModelManager,
-    SetupStep,
-    generate_setup_py,
-    get_app_version,
-    get_bundle_info,
-    get_py2app_options,
-)
-from recall.app.hotkeys import (
-    HotkeyConfig,
-    HotkeyManager,
-    detect_conflicts,
-    format_hotkey_display,
-    parse_hotkey,
-)
-from recall.app.installer import (
-    AppLauncher,
-    DMGBuilder,
-    FirstRunWizard,
-    InstallerConfig,
-    LaunchMode,
-    WizardPage,
-    generate_build_script,
-    generate_dmg_script,
-    generate_install_docs,
-    generate_permissions_docs,
-    get_installer_version,
-    get_minimum_macos_version,
-)
-from recall.app.menubar import (
-    AppState,
-    MenuItem,
-    RecallMenuBar,
-)
-from recall.app.notifications import (
-    AutoRecordingConfig,
-    AutoRecordingTrigger,
-    NotificationManager,
-)
-from recall.app.permissions import (
-    PermissionInfo,
-    PermissionManager,
-    PermissionStatus,
-    PermissionType,
-    get_permission_instructions,
-    get_preferences_url,
-)
-from recall.app.recording import (
-    RecordingController,
-    RecordingStatus,
-)
+Submodules are imported on first attribute access, so importing one part
+of the app (e.g. the launcher) does not pull in rumps, pynput or the audio
+stack through this package.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from recall.app.bundle import (
+        AppConfig,
+        DownloadProgressEvent,
+        FirstRunSetup,
+        ModelInfo,
+        ModelManager,
+        SetupStep,
+        generate_setup_py,
+        get_app_version,
+        get_bundle_info,
+        get_py2app_options,
+    )
+    from recall.app.hotkeys import (
+        HotkeyConfig,
+        HotkeyManager,
+        detect_conflicts,
+        format_hotkey_display,
+        parse_hotkey,
+    )
+    from recall.app.installer import (
+        AppLauncher,
+        DMGBuilder,
+        FirstRunWizard,
+        InstallerConfig,
+        LaunchMode,
+        WizardPage,
+        generate_build_script,
+        generate_dmg_script,
+        generate_install_docs,
+        generate_permissions_docs,
+        get_installer_version,
+        get_minimum_macos_version,
+    )
+    from recall.app.menubar import (
+        AppState,
+        MenuItem,
+        RecallMenuBar,
+    )
+    from recall.app.notifications import (
+        AutoRecordingConfig,
+        AutoRecordingTrigger,
+        NotificationManager,
+    )
+    from recall.app.permissions import (
+        PermissionInfo,
+        PermissionManager,
+        PermissionStatus,
+        PermissionType,
+        get_permission_instructions,
+        get_preferences_url,
+    )
+    from recall.app.recording import (
+        RecordingController,
+        RecordingStatus,
+    )
+
+# Maps each exported name to the submodule that defines it
+_LAZY_IMPORTS = {
+    "AppConfig": "recall.app.bundle",
+    "DownloadProgressEvent": "recall.app.bundle",
+    "FirstRunSetup": "recall.app.bundle",
+    "ModelInfo": "recall.app.bundle",
+    "ModelManager": "recall.app.bundle",
+    "SetupStep": "recall.app.bundle",
+    "generate_setup_py": "recall.app.bundle",
+    "get_app_version": "recall.app.bundle",
+    "get_bundle_info": "recall.app.bundle",
+    "get_py2app_options": "recall.app.bundle",
+    "HotkeyConfig": "recall.app.hotkeys",
+    "HotkeyManager": "recall.app.hotkeys",
+    "detect_conflicts": "recall.app.hotkeys",
+    "format_hotkey_display": "recall.app.hotkeys",
+    "parse_hotkey": "recall.app.hotkeys",
+    "AppLauncher": "recall.app.installer",
+    "DMGBuilder": "recall.app.installer",
+    "FirstRunWizard": "recall.app.installer",
+    "InstallerConfig": "recall.app.installer",
+    "LaunchMode": "recall.app.installer",
+    "WizardPage": "recall.app.installer",
+    "generate_build_script": "recall.app.installer",
+    "generate_dmg_script": "recall.app.installer",
+    "generate_install_docs": "recall.app.installer",
+    "generate_permissions_docs": "recall.app.installer",
+    "get_installer_version": "recall.app.installer",
+    "get_minimum_macos_version": "recall.app.installer",
+    "AppState": "recall.app.menubar",
+    "MenuItem": "recall.app.menubar",
+    "RecallMenuBar": "recall.app.menubar",
+    "AutoRecordingConfig": "recall.app.notifications",
+    "AutoRecordingTrigger": "recall.app.notifications",
+    "NotificationManager": "recall.app.notifications",
+    "PermissionInfo": "recall.app.permissions",
+    "PermissionManager": "recall.app.permissions",
+    "PermissionStatus": "recall.app.permissions",
+    "PermissionType": "recall.app.permissions",
+    "get_permission_instructions": "recall.app.permissions",
+    "get_preferences_url": "recall.app.permissions",
+    "RecordingController": "recall.app.recording",
+    "RecordingStatus": "recall.app.recording",
+}
 
 __all__ = [
     # Menu Bar
@@ -106,3 +160,14 @@ __all__ = [
     "get_installer_version",
     "get_minimum_macos_version",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names from their submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
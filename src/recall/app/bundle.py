@@ -6,14 +6,35 @@ This module provides:
 - First-run setup experience
 """
 
-import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 
 # Default models directory
 DEFAULT_MODELS_DIR = Path.home() / ".recall" / "models"
 
+# Pre-encoded contents of the setup-complete sentinel file
+_SETUP_COMPLETE_CONTENT = b'{"version": "0.1.0"}'
+
+# Read size for streamed model downloads
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Directories already created by this process
+_ensured_dirs: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory once per process.
+
+    Args:
+        path: Directory to create if missing.
+    """
+    if path in _ensured_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(path)
+
 
 @dataclass
 class AppConfig:
@@ -98,7 +119,11 @@ class ModelManager:
             models_dir: Directory for storing models. Defaults to ~/.recall/models
         """
         self.models_dir = models_dir or DEFAULT_MODELS_DIR
-        self.models_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.models_dir)
+
+        # Missing-model result, valid while the directory mtime is unchanged
+        self._missing_cache: Optional[list[ModelInfo]] = None
+        self._missing_cache_mtime: Optional[int] = None
 
     def get_required_models(self) -> list[ModelInfo]:
         """Get list of required models.
@@ -108,6 +133,14 @@ class ModelManager:
         """
         return self.REQUIRED_MODELS.copy()
 
+    def iter_required_models(self) -> Iterator[ModelInfo]:
+        """Iterate over required models without copying the list.
+
+        Returns:
+            Iterator over ModelInfo for required models.
+        """
+        return iter(self.REQUIRED_MODELS)
+
     def check_model_exists(self, model: ModelInfo) -> bool:
         """Check if a model file exists.
 
@@ -120,13 +153,40 @@ class ModelManager:
         model_path = self.models_dir / model.filename
         return model_path.exists()
 
+    def _scan_models_dir(self) -> set[str]:
+        """List the entry names in the models directory in a single pass.
+
+        Returns:
+            Set of file names present in the models directory.
+        """
+        try:
+            with os.scandir(self.models_dir) as entries:
+                return {entry.name for entry in entries}
+        except FileNotFoundError:
+            return set()
+
     def get_missing_models(self) -> list[ModelInfo]:
         """Get list of models that need to be downloaded.
 
+        The result is cached until the models directory's mtime changes, so
+        repeated polling does not rescan the directory.
+
         Returns:
             List of ModelInfo for missing models.
         """
-        return [m for m in self.get_required_models() if not self.check_model_exists(m)]
+        try:
+            mtime = os.stat(self.models_dir).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        if self._missing_cache is None or mtime != self._missing_cache_mtime:
+            present = self._scan_models_dir()
+            self._missing_cache = [
+                m for m in self.iter_required_models() if m.filename not in present
+            ]
+            self._missing_cache_mtime = mtime
+
+        return self._missing_cache.copy()
 
     def download_model(
         self,
@@ -145,7 +205,10 @@ class ModelManager:
         output_path = self.models_dir / model.filename
 
         # Call the actual download
-        result = self._download_file(model.url, output_path, model.size_mb, on_progress)
+        result = self._download_file(
+            model.url, output_path, model.size_mb, on_progress, sha256=model.sha256
+        )
+        self._missing_cache = None
 
         # Notify completion if callback provided
         if on_progress:
@@ -166,22 +229,42 @@ class ModelManager:
         output_path: Path,
         total_mb: float,
         on_progress: Optional[Callable[[DownloadProgressEvent], None]] = None,
+        sha256: str = "",
     ) -> Path:
         """Internal method to download a file with progress.
 
+        The SHA256 digest is computed while the file streams to disk, so
+        verification does not need a second read of the file.
+
         Args:
             url: URL to download from.
             output_path: Path to save file to.
             total_mb: Expected file size in MB.
             on_progress: Optional progress callback.
+            sha256: Expected hex digest. Verification is skipped if empty.
 
         Returns:
             Path to downloaded file.
+
+        Raises:
+            ValueError: If the downloaded file does not match sha256.
         """
+        import hashlib
         import urllib.request
 
-        # Simple download - can be enhanced with chunked download and progress
-        urllib.request.urlretrieve(url, output_path)
+        digest = hashlib.sha256()
+        with urllib.request.urlopen(url) as response, open(output_path, "wb") as out:
+            while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                out.write(chunk)
+
+        if sha256 and digest.hexdigest() != sha256.lower():
+            output_path.unlink(missing_ok=True)
+            raise ValueError(
+                f"Checksum mismatch for {output_path.name}: "
+                f"expected {sha256}, got {digest.hexdigest()}"
+            )
+
         return output_path
 
 
@@ -235,7 +318,7 @@ class FirstRunSetup:
             config_dir: Directory for storing config. Defaults to ~/.recall
         """
         self.config_dir = config_dir or (Path.home() / ".recall")
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.config_dir)
         self._setup_file = self.config_dir / self.SETUP_COMPLETE_FILE
 
     def is_first_run(self) -> bool:
@@ -248,7 +331,7 @@ class FirstRunSetup:
 
     def mark_setup_complete(self) -> None:
         """Mark the setup as complete."""
-        self._setup_file.write_text(json.dumps({"version": "0.1.0"}))
+        self._setup_file.write_bytes(_SETUP_COMPLETE_CONTENT)
 
     def get_setup_steps(self) -> list[SetupStep]:
         """Get the setup steps.
@@ -1,27 +1,54 @@
 """Global Hotkeys for Recall Menu Bar App.
 
 This module provides:
-- Global keyboard shortcuts using pynput
+- Global keyboard shortcuts using pynput, or a Quartz event tap on the
+  main run loop when running inside the menu bar app
 - Hotkey configuration
 - Conflict detection
 """
 
+import ctypes
+import ctypes.util
+import functools
+import importlib.util
 import logging
+import re
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional
 
-# Check if pynput is available
-try:
-    from pynput import keyboard
+# Check if pynput is available without importing it; pynput pulls in the
+# Quartz/AppKit bindings, so the import is deferred until a listener starts.
+PYNPUT_AVAILABLE = importlib.util.find_spec("pynput") is not None
+keyboard = None
 
-    PYNPUT_AVAILABLE = True
-except ImportError:
-    keyboard = None
-    PYNPUT_AVAILABLE = False
+# Quartz (pyobjc) is only present on macOS; like pynput it is imported lazily
+QUARTZ_AVAILABLE = importlib.util.find_spec("Quartz") is not None
 
 logger = logging.getLogger(__name__)
 
 
+def _get_keyboard():
+    """Import and cache the pynput keyboard module on first use.
+
+    find_spec() only shows that pynput is installed; the import itself can
+    still fail, e.g. when its pyobjc backend is missing or broken.
+
+    Returns:
+        The pynput.keyboard module, or None if it cannot be imported.
+    """
+    global keyboard, PYNPUT_AVAILABLE
+    if keyboard is None:
+        try:
+            from pynput import keyboard as pynput_keyboard
+        except ImportError as e:
+            logger.warning(f"pynput failed to import: {e}")
+            PYNPUT_AVAILABLE = False
+            return None
+
+        keyboard = pynput_keyboard
+    return keyboard
+
+
 # Modifier key mappings for display
 MODIFIER_DISPLAY = {
     "cmd": "⌘",
@@ -32,6 +59,187 @@ MODIFIER_DISPLAY = {
     "shift": "⇧",
 }
 
+# Matches the individual tokens of a hotkey string, dropping "+" and "<>"
+_HOTKEY_TOKEN_RE = re.compile(r"[^+<>]+")
+
+# Quartz event flag attribute for each modifier name
+_QUARTZ_MODIFIER_FLAGS = {
+    "cmd": "kCGEventFlagMaskCommand",
+    "super": "kCGEventFlagMaskCommand",
+    "ctrl": "kCGEventFlagMaskControl",
+    "alt": "kCGEventFlagMaskAlternate",
+    "option": "kCGEventFlagMaskAlternate",
+    "shift": "kCGEventFlagMaskShift",
+}
+
+# macOS virtual key codes (kVK_*) for named keys; these keys sit in the same
+# place on every keyboard layout
+_MAC_NAMED_KEY_CODES = {
+    "space": 49,
+    "f5": 96,
+    "f6": 97,
+    "f7": 98,
+    "f3": 99,
+    "f8": 100,
+    "f9": 101,
+    "f11": 103,
+    "f10": 109,
+    "f12": 111,
+    "f4": 118,
+    "f2": 120,
+    "f1": 122,
+}
+_MAC_NAMED_KEYS_BY_CODE = {code: name for name, code in _MAC_NAMED_KEY_CODES.items()}
+
+# Characters of the ANSI (US QWERTY) keys, used when the current keyboard
+# layout can't be read
+_ANSI_KEY_CHARACTERS = {
+    0: "a",
+    1: "s",
+    2: "d",
+    3: "f",
+    4: "h",
+    5: "g",
+    6: "z",
+    7: "x",
+    8: "c",
+    9: "v",
+    11: "b",
+    12: "q",
+    13: "w",
+    14: "e",
+    15: "r",
+    16: "y",
+    17: "t",
+    18: "1",
+    19: "2",
+    20: "3",
+    21: "4",
+    22: "6",
+    23: "5",
+    25: "9",
+    26: "7",
+    28: "8",
+    29: "0",
+    31: "o",
+    32: "u",
+    34: "i",
+    35: "p",
+    37: "l",
+    38: "j",
+    40: "k",
+    43: ",",
+    44: "/",
+    45: "n",
+    46: "m",
+    47: ".",
+}
+
+# UCKeyTranslate arguments: kUCKeyActionDisplay, 1 << kUCKeyTranslateNoDeadKeysBit,
+# and the Shift key in UCKeyTranslate's modifier state ((shiftKey >> 8) & 0xFF)
+_UC_KEY_ACTION_DISPLAY = 3
+_UC_NO_DEAD_KEYS = 1
+_UC_SHIFT_KEY_STATE = 2
+
+
+@functools.lru_cache(maxsize=None)
+def _carbon_key_layout() -> Optional[tuple]:
+    """Load the Carbon functions for reading the current keyboard layout.
+
+    Returns:
+        (Carbon library, CoreFoundation library, layout data property), or
+        None if they are not available (e.g. off macOS).
+    """
+    carbon_path = ctypes.util.find_library("Carbon")
+    cf_path = ctypes.util.find_library("CoreFoundation")
+    if carbon_path is None or cf_path is None:
+        return None
+
+    try:
+        carbon = ctypes.cdll.LoadLibrary(carbon_path)
+        cf = ctypes.cdll.LoadLibrary(cf_path)
+        layout_property = ctypes.c_void_p.in_dll(carbon, "kTISPropertyUnicodeKeyLayoutData")
+    except (OSError, ValueError) as e:
+        logger.warning(f"Keyboard layout unavailable, assuming US key positions: {e}")
+        return None
+
+    carbon.TISCopyCurrentKeyboardLayoutInputSource.restype = ctypes.c_void_p
+    carbon.TISGetInputSourceProperty.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    carbon.TISGetInputSourceProperty.restype = ctypes.c_void_p
+    carbon.LMGetKbdType.restype = ctypes.c_uint8
+    carbon.UCKeyTranslate.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_uint16,
+        ctypes.c_uint16,
+        ctypes.c_uint32,
+        ctypes.c_uint32,
+        ctypes.c_uint32,
+        ctypes.POINTER(ctypes.c_uint32),
+        ctypes.c_ulong,
+        ctypes.POINTER(ctypes.c_ulong),
+        ctypes.POINTER(ctypes.c_uint16),
+    ]
+    carbon.UCKeyTranslate.restype = ctypes.c_int32
+    cf.CFDataGetBytePtr.argtypes = [ctypes.c_void_p]
+    cf.CFDataGetBytePtr.restype = ctypes.c_void_p
+    cf.CFRelease.argtypes = [ctypes.c_void_p]
+    return carbon, cf, layout_property.value
+
+
+def _key_code_characters(key_code: int) -> tuple:
+    """Get the characters a key types under the current keyboard layout.
+
+    The layout is read on each call, so switching layouts while the app runs
+    takes effect right away.
+
+    Args:
+        key_code: macOS virtual key code of the key.
+
+    Returns:
+        The key's character without and with Shift, case-folded; a key like
+        "1" on AZERTY only produces its digit with Shift held.
+    """
+    ansi = _ANSI_KEY_CHARACTERS.get(key_code)
+    fallback = (ansi,) if ansi else ()
+
+    libs = _carbon_key_layout()
+    if libs is None:
+        return fallback
+    carbon, cf, layout_property = libs
+
+    source = carbon.TISCopyCurrentKeyboardLayoutInputSource()
+    if not source:
+        return fallback
+    try:
+        data = carbon.TISGetInputSourceProperty(source, layout_property)
+        if not data:
+            return fallback
+        layout = cf.CFDataGetBytePtr(data)
+
+        characters = []
+        for modifier_state in (0, _UC_SHIFT_KEY_STATE):
+            dead_key_state = ctypes.c_uint32(0)
+            length = ctypes.c_ulong(0)
+            buffer = (ctypes.c_uint16 * 4)()
+            status = carbon.UCKeyTranslate(
+                layout,
+                key_code,
+                _UC_KEY_ACTION_DISPLAY,
+                modifier_state,
+                carbon.LMGetKbdType(),
+                _UC_NO_DEAD_KEYS,
+                ctypes.byref(dead_key_state),
+                len(buffer),
+                ctypes.byref(length),
+                buffer,
+            )
+            if status == 0 and length.value:
+                text = bytes(buffer)[: 2 * length.value].decode("utf-16-le", errors="ignore")
+                characters.append(text.casefold())
+        return tuple(characters)
+    finally:
+        cf.CFRelease(source)
+
 
 @dataclass
 class HotkeyConfig:
@@ -106,13 +314,17 @@ class HotkeyManager:
     - Starting/stopping the listener
     """
 
-    def __init__(self, config: HotkeyConfig) -> None:
+    def __init__(self, config: HotkeyConfig, use_main_run_loop: bool = False) -> None:
         """Initialize the hotkey manager.
 
         Args:
             config: Hotkey configuration.
+            use_main_run_loop: Listen with a Quartz event tap on the main run
+                loop instead of a pynput thread, so callbacks fire on the main
+                thread. Only useful when a Cocoa run loop is running.
         """
         self.config = config
+        self.use_main_run_loop = use_main_run_loop
         self._listener = None
         self._is_listening = False
 
@@ -133,10 +345,6 @@ class HotkeyManager:
             logger.info("Hotkeys are disabled, not starting listener")
             return
 
-        if not PYNPUT_AVAILABLE:
-            logger.warning("pynput not available, hotkeys disabled")
-            return
-
         # Build hotkey mappings
         hotkeys = {
             self.config.toggle_recording: self._handle_toggle_recording,
@@ -145,7 +353,25 @@ class HotkeyManager:
             self.config.open_search: self._handle_open_search,
         }
 
-        self._listener = keyboard.GlobalHotKeys(hotkeys)
+        if self.use_main_run_loop and QUARTZ_AVAILABLE:
+            listener = MainRunLoopHotKeys(hotkeys)
+            try:
+                listener.start()
+            except Exception as e:
+                # Hotkeys start with the app, so a failed tap must not stop it launching
+                logger.warning(f"Main run loop hotkeys unavailable, falling back to pynput: {e}")
+            else:
+                self._listener = listener
+                self._is_listening = True
+                logger.info("Started hotkey event tap on the main run loop")
+                return
+
+        keyboard_module = _get_keyboard() if PYNPUT_AVAILABLE else None
+        if keyboard_module is None:
+            logger.warning("pynput not available, hotkeys disabled")
+            return
+
+        self._listener = keyboard_module.GlobalHotKeys(hotkeys)
         self._listener.start()
         self._is_listening = True
         logger.info("Started hotkey listener")
@@ -184,6 +410,123 @@ class HotkeyManager:
             self.on_open_search()
 
 
+class MainRunLoopHotKeys:
+    """Global hotkey listener backed by a Quartz event tap.
+
+    The tap is a listen-only source on the main run loop, so unlike
+    pynput's GlobalHotKeys no extra thread is started and callbacks run on
+    the main thread, where they may update the UI directly. Key repeats are
+    ignored. It has the same start()/stop() interface as GlobalHotKeys.
+
+    Character keys are matched by what they type under the current keyboard
+    layout, not by position, so "<cmd>+<shift>+r" means the R key on AZERTY
+    or Dvorak too.
+    """
+
+    def __init__(self, hotkeys: Dict[str, Callable[[], None]]) -> None:
+        """Initialize the listener.
+
+        Args:
+            hotkeys: Mapping of hotkey strings like "<cmd>+<shift>+r" to callbacks.
+        """
+        self._hotkeys = hotkeys
+        self._bindings: Dict[int, Dict[str, Callable[[], None]]] = {}
+        self._modifier_mask = 0
+        self._tap = None
+        self._source = None
+
+    def start(self) -> None:
+        """Install the event tap on the main run loop.
+
+        Raises:
+            ValueError: If a hotkey ends in a named key without a known key code.
+            RuntimeError: If the event tap cannot be created, usually because
+                Accessibility access has not been granted.
+        """
+        import Quartz  # type: ignore
+
+        self._modifier_mask = 0
+        for flag_name in set(_QUARTZ_MODIFIER_FLAGS.values()):
+            self._modifier_mask |= getattr(Quartz, flag_name)
+
+        self._bindings = {}
+        for hotkey_str, callback in self._hotkeys.items():
+            parsed = parse_hotkey(hotkey_str)
+            key = parsed["key"]
+            if len(key) != 1 and key not in _MAC_NAMED_KEY_CODES:
+                raise ValueError(f"No key code for hotkey {hotkey_str!r}")
+
+            flags = 0
+            for mod in parsed["modifiers"]:
+                flags |= getattr(Quartz, _QUARTZ_MODIFIER_FLAGS[mod])
+            self._bindings.setdefault(flags, {})[key.casefold()] = callback
+
+        self._tap = Quartz.CGEventTapCreate(
+            Quartz.kCGSessionEventTap,
+            Quartz.kCGHeadInsertEventTap,
+            Quartz.kCGEventTapOptionListenOnly,
+            Quartz.CGEventMaskBit(Quartz.kCGEventKeyDown),
+            self._handle_event,
+            None,
+        )
+        if self._tap is None:
+            raise RuntimeError("Could not create keyboard event tap")
+
+        self._source = Quartz.CFMachPortCreateRunLoopSource(None, self._tap, 0)
+        Quartz.CFRunLoopAddSource(
+            Quartz.CFRunLoopGetMain(), self._source, Quartz.kCFRunLoopCommonModes
+        )
+        Quartz.CGEventTapEnable(self._tap, True)
+
+    def stop(self) -> None:
+        """Remove the event tap from the main run loop."""
+        if self._tap is None:
+            return
+
+        import Quartz  # type: ignore
+
+        Quartz.CGEventTapEnable(self._tap, False)
+        Quartz.CFRunLoopRemoveSource(
+            Quartz.CFRunLoopGetMain(), self._source, Quartz.kCFRunLoopCommonModes
+        )
+        Quartz.CFMachPortInvalidate(self._tap)
+        self._tap = None
+        self._source = None
+
+    def _handle_event(self, proxy: Any, event_type: int, event: Any, refcon: Any) -> Any:
+        """Dispatch a key-down event to the matching hotkey callback."""
+        import Quartz  # type: ignore
+
+        # macOS disables slow taps; turn it back on and carry on listening
+        if event_type == Quartz.kCGEventTapDisabledByTimeout:
+            Quartz.CGEventTapEnable(self._tap, True)
+            return event
+
+        if Quartz.CGEventGetIntegerValueField(event, Quartz.kCGKeyboardEventAutorepeat):
+            return event
+
+        # Most key presses don't carry a bound modifier combination, so the
+        # key is only translated through the layout once the flags match
+        flags = Quartz.CGEventGetFlags(event) & self._modifier_mask
+        keys = self._bindings.get(flags)
+        if not keys:
+            return event
+
+        key_code = Quartz.CGEventGetIntegerValueField(event, Quartz.kCGKeyboardEventKeycode)
+        if key_code in _MAC_NAMED_KEYS_BY_CODE:
+            candidates: tuple = (_MAC_NAMED_KEYS_BY_CODE[key_code],)
+        else:
+            candidates = _key_code_characters(key_code)
+
+        for key in candidates:
+            callback = keys.get(key)
+            if callback:
+                callback()
+                break
+
+        return event
+
+
 def parse_hotkey(hotkey_str: str) -> Dict[str, Any]:
     """Parse a hotkey string into components.
 
@@ -193,18 +536,14 @@ def parse_hotkey(hotkey_str: str) -> Dict[str, Any]:
     Returns:
         Dictionary with 'modifiers' list and 'key' string.
     """
-    parts = hotkey_str.lower().split("+")
     modifiers = []
     key = ""
 
-    for part in parts:
-        # Remove angle brackets
-        clean = part.strip("<>")
-
-        if clean in ("cmd", "super", "ctrl", "alt", "option", "shift"):
-            modifiers.append(clean)
+    for token in _HOTKEY_TOKEN_RE.findall(hotkey_str.lower()):
+        if token in MODIFIER_DISPLAY:
+            modifiers.append(token)
         else:
-            key = clean
+            key = token
 
     return {
         "modifiers": modifiers,
@@ -212,9 +551,13 @@ def parse_hotkey(hotkey_str: str) -> Dict[str, Any]:
     }
 
 
+@functools.lru_cache(maxsize=None)
 def format_hotkey_display(hotkey_str: str) -> str:
     """Format a hotkey string for display.
 
+    Results are memoized since the same few hotkeys are rendered on every
+    menu update.
+
     Args:
         hotkey_str: Hotkey string like "<cmd>+<shift>+r"
 
@@ -222,16 +565,11 @@ def format_hotkey_display(hotkey_str: str) -> str:
         Display string like "⌘⇧R"
     """
     parsed = parse_hotkey(hotkey_str)
-    parts = []
-
-    for mod in parsed["modifiers"]:
-        symbol = MODIFIER_DISPLAY.get(mod, mod.capitalize())
-        parts.append(symbol)
 
-    if parsed["key"]:
-        parts.append(parsed["key"].upper())
+    # parse_hotkey only reports modifiers present in MODIFIER_DISPLAY
+    symbols = "".join(MODIFIER_DISPLAY[mod] for mod in parsed["modifiers"])
 
-    return "".join(parts)
+    return symbols + parsed["key"].upper()
 
 
 def detect_conflicts(config: HotkeyConfig) -> List[Dict[str, Any]]:
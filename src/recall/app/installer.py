@@ -7,14 +7,38 @@ This module provides:
 - Documentation generation
 """
 
-import json
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Callable, Optional
 
-# Default paths
-DEFAULT_CONFIG_DIR = Path.home() / ".recall"
+
+def _default_config_dir() -> Path:
+    """Get the default config directory, resolving it on first use.
+
+    Path.home() may consult the password database or a slow network home
+    directory, so it is looked up lazily rather than at import time.
+
+    Returns:
+        Path to ~/.recall.
+    """
+    config_dir = globals().get("DEFAULT_CONFIG_DIR")
+    if config_dir is None:
+        config_dir = Path.home() / ".recall"
+        globals()["DEFAULT_CONFIG_DIR"] = config_dir
+    return config_dir
+
+
+def __getattr__(name: str):
+    """Provide DEFAULT_CONFIG_DIR as a lazily computed module attribute."""
+    if name == "DEFAULT_CONFIG_DIR":
+        return _default_config_dir()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Pre-encoded contents of the setup-complete sentinel file
+_SETUP_COMPLETE_CONTENT = b'{"version": "0.1.0", "setup_complete": true}'
 
 
 class LaunchMode(Enum):
@@ -25,7 +49,7 @@ class LaunchMode(Enum):
     MODEL_DOWNLOAD = "model_download"
 
 
-@dataclass
+@dataclass(slots=True)
 class InstallerConfig:
     """Configuration for DMG installer."""
 
@@ -38,7 +62,7 @@ class InstallerConfig:
     icon_size: int = 128
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WizardPage:
     """A page in the first-run wizard."""
 
@@ -47,11 +71,24 @@ class WizardPage:
     description: str
     can_skip: bool = False
     action: Optional[Callable[[], bool]] = None
+    rendered: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Pre-render the page text for console output."""
+        underline = "-" * len(self.title)
+        object.__setattr__(self, "rendered", f"\n{self.title}\n{underline}\n{self.description}\n\n")
 
 
 class DMGBuilder:
     """Builds DMG installer for macOS."""
 
+    # Icon layout is the same for every build, so it is defined once; each
+    # spec gets its own copy of the entries
+    DMG_CONTENTS = (
+        {"x": 150, "y": 200, "type": "file", "path": "dist/Recall.app"},
+        {"x": 450, "y": 200, "type": "link", "path": "/Applications"},
+    )
+
     def __init__(self, config: Optional[InstallerConfig] = None):
         """Initialize DMG builder.
 
@@ -75,15 +112,7 @@ class DMGBuilder:
                 "height": self.config.window_height,
             },
             "icon_size": self.config.icon_size,
-            "contents": [
-                {"x": 150, "y": 200, "type": "file", "path": "dist/Recall.app"},
-                {
-                    "x": 450,
-                    "y": 200,
-                    "type": "link",
-                    "path": "/Applications",
-                },
-            ],
+            "contents": [dict(entry) for entry in self.DMG_CONTENTS],
             "symlinks": {"Applications": "/Applications"},
             "background": self.config.background_image,
         }
@@ -92,7 +121,7 @@ class DMGBuilder:
 class FirstRunWizard:
     """First-run setup wizard."""
 
-    DEFAULT_PAGES = [
+    DEFAULT_PAGES: tuple[WizardPage, ...] = (
         WizardPage(
             name="welcome",
             title="Welcome to Recall",
@@ -145,17 +174,18 @@ Quick tips:
 Enjoy using Recall!""",
             can_skip=False,
         ),
-    ]
+    )
 
     def __init__(self):
         """Initialize first-run wizard."""
-        self._pages = [WizardPage(**p.__dict__) for p in self.DEFAULT_PAGES]
+        # Pages are frozen, so the defaults can be shared between wizards
+        self._pages = self.DEFAULT_PAGES
 
-    def get_pages(self) -> list[WizardPage]:
+    def get_pages(self) -> tuple[WizardPage, ...]:
         """Get wizard pages.
 
         Returns:
-            List of WizardPage objects.
+            Tuple of WizardPage objects.
         """
         return self._pages
 
@@ -171,21 +201,49 @@ class AppLauncher:
         Args:
             config_dir: Configuration directory path.
         """
-        self.config_dir = config_dir or DEFAULT_CONFIG_DIR
+        self.config_dir = config_dir or _default_config_dir()
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self._setup_file = self.config_dir / self.SETUP_COMPLETE_FILE
+        self._is_first_run: Optional[bool] = None
+        self._model_manager = None
+
+    @property
+    def model_manager(self):
+        """Get the model manager, creating it on first access.
+
+        Normal launches never touch models before the menu bar starts, so
+        the bundle module is only imported when this is first used.
+
+        Returns:
+            ModelManager for the models directory under config_dir.
+        """
+        if self._model_manager is None:
+            from recall.app.bundle import ModelManager
+
+            self._model_manager = ModelManager(models_dir=self.config_dir / "models")
+        return self._model_manager
 
     def is_first_run(self) -> bool:
         """Check if this is the first run.
 
+        The result is cached after the first check and updated by
+        mark_first_run_complete().
+
         Returns:
             True if setup has not been completed.
         """
-        return not self._setup_file.exists()
+        if self._is_first_run is None:
+            self._is_first_run = not self._setup_file.exists()
+        return self._is_first_run
 
     def mark_first_run_complete(self) -> None:
         """Mark first run as complete."""
-        self._setup_file.write_text(json.dumps({"version": "0.1.0", "setup_complete": True}))
+        fd = os.open(self._setup_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, _SETUP_COMPLETE_CONTENT)
+        finally:
+            os.close(fd)
+        self._is_first_run = False
 
     def get_launch_mode(self) -> LaunchMode:
         """Get the appropriate launch mode.
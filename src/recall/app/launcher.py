@@ -8,14 +8,15 @@ It handles first-run setup and launches the menu bar application.
 import sys
 from pathlib import Path
 
+# Ensure we can import recall modules; the path never changes, so this is
+# done once at import rather than on every call to main()
+_SRC_PATH = str(Path(__file__).resolve().parents[2])
+if _SRC_PATH not in sys.path:
+    sys.path.insert(0, _SRC_PATH)
+
 
 def main():
     """Main entry point for Recall app."""
-    # Ensure we can import recall modules
-    src_path = Path(__file__).parent.parent.parent
-    if str(src_path) not in sys.path:
-        sys.path.insert(0, str(src_path))
-
     from recall.app.installer import AppLauncher, LaunchMode
 
     # Check launch mode
@@ -37,7 +38,6 @@ def run_first_run_wizard(launcher):
     Args:
         launcher: AppLauncher instance.
     """
-    from recall.app.bundle import ModelManager
     from recall.app.installer import FirstRunWizard
     from recall.app.permissions import PermissionManager
 
@@ -48,17 +48,18 @@ def run_first_run_wizard(launcher):
 
     wizard = FirstRunWizard()
     pages = wizard.get_pages()
+    perm_manager = PermissionManager()
+
+    # Without a terminal (e.g. launched from Finder) there is nobody to
+    # press Enter, and input() would raise EOFError
+    interactive = sys.stdin is not None and sys.stdin.isatty()
 
     for page in pages:
-        print(f"\n{page.title}")
-        print("-" * len(page.title))
-        print(page.description)
-        print()
+        sys.stdout.write(page.rendered)
 
         if page.name == "model_download":
             # Check and download models
-            model_manager = ModelManager()
-            missing = model_manager.get_missing_models()
+            missing = launcher.model_manager.get_missing_models()
 
             if missing:
                 print(f"Missing models: {[m.name for m in missing]}")
@@ -68,10 +69,10 @@ def run_first_run_wizard(launcher):
 
         elif page.name == "permissions":
             # Show permission status
-            perm_manager = PermissionManager()
             print(perm_manager.get_permission_summary())
 
-        input("Press Enter to continue...")
+        if interactive:
+            input("Press Enter to continue...")
 
     # Mark setup complete
     launcher.mark_first_run_complete()
@@ -10,11 +10,22 @@ Usage on macOS:
     app.run()
 """
 
-import time
+import functools
+import logging
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from types import MethodType
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    from recall.app.hotkeys import HotkeyConfig, HotkeyManager
+    from recall.app.notifications import AutoRecordingConfig, NotificationManager
+    from recall.app.recording import RecordingController, RecordingStatus
+    from recall.storage.models import Recording
 
 # Check if rumps is available (macOS only)
 try:
@@ -24,6 +35,15 @@ try:
 except ImportError:
     RUMPS_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+
+# Seconds notifications are held so identical duplicates show one banner
+NOTIFICATION_COALESCE_WINDOW = 0.25
+
+# Where recordings are saved when no output directory is given
+DEFAULT_RECORDINGS_DIR = Path.home() / ".recall" / "recordings"
+
 
 class AppState(Enum):
     """Application state for the menu bar.
@@ -38,36 +58,45 @@ class AppState(Enum):
     @property
     def icon(self) -> str:
         """Get the menu bar icon for this state."""
-        icons = {
-            AppState.IDLE: "🎤",
-            AppState.RECORDING: "🔴",
-            AppState.PROCESSING: "⚙️",
-        }
-        return icons[self]
+        return _STATE_ICONS[self]
 
 
-@dataclass
+_STATE_ICONS = {
+    AppState.IDLE: "🎤",
+    AppState.RECORDING: "🔴",
+    AppState.PROCESSING: "⚙️",
+}
+
+
+@dataclass(frozen=True, slots=True)
 class MenuItem:
     """Represents a menu item in the menu bar dropdown.
 
     Attributes:
         title: Display text for the menu item
-        callback: Name of the callback method to invoke
+        callback: RecallMenuBar method to invoke; it is bound to the app
+            when the menu is built
         key: Optional keyboard shortcut (single character)
         enabled: Whether the item is clickable
         is_separator: If True, this is a separator line
     """
 
     title: str = ""
-    callback: Optional[str] = None
+    callback: Optional[Callable[..., None]] = None
     key: Optional[str] = None
     enabled: bool = True
     is_separator: bool = False
 
     @classmethod
     def separator(cls) -> "MenuItem":
-        """Create a separator menu item."""
-        return cls(is_separator=True)
+        """Get the separator menu item.
+
+        Menu items are immutable, so all separators share one instance.
+        """
+        return _SEPARATOR
+
+
+_SEPARATOR = MenuItem(is_separator=True)
 
 
 class RecallMenuBar:
@@ -88,43 +117,106 @@ class RecallMenuBar:
         Args:
             output_dir: Optional directory for recording output.
         """
-        from recall.app.hotkeys import HotkeyConfig, HotkeyManager
-        from recall.app.notifications import (
-            AutoRecordingConfig,
-            NotificationManager,
-        )
-        from recall.app.recording import RecordingController
-
         self.name = "Recall"
         self._state = AppState.IDLE
         self._icon = AppState.IDLE.icon
         self._quit_requested = False
-        self._recording_start_time: Optional[float] = None
-
-        # Initialize recording controller
-        self.recording_controller = RecordingController(output_dir=output_dir)
-
-        # Initialize notification manager
-        self.notification_manager = NotificationManager()
-
-        # Initialize auto-recording configuration
-        self.auto_recording_config = AutoRecordingConfig()
-
-        # Initialize hotkey manager
-        self.hotkey_config = HotkeyConfig()
-        self.hotkey_manager = HotkeyManager(self.hotkey_config)
-        self._setup_hotkey_callbacks()
+        self._recording_menu_item = None
+        self._shown_recording_item: Optional[MenuItem] = None
+        self._output_dir = output_dir
+        self._main_thread = threading.main_thread()
+        self._ui_refresh_pending = False
+        self._recording_controller_future: Optional[Future] = None
+        self._ingest_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="recall-ingest"
+        )
 
-        # Initialize rumps app if available
+        # Initialize rumps app if available. This is decided once here: in
+        # mock mode _rumps_app stays None, and that is the only check the UI
+        # update paths make.
         if RUMPS_AVAILABLE:
             self._rumps_app = rumps.App(
                 self.name,
                 title=self._icon,
                 quit_button=None,  # We'll add our own quit
             )
+            self._duration_timer = rumps.Timer(self._tick_duration_title, 1.0)
             self._setup_rumps_menu()
         else:
             self._rumps_app = None
+            self._duration_timer = None
+
+    # ========================================================================
+    # Subsystems
+    # ========================================================================
+    #
+    # The subsystems pull in the audio, ingestion and hotkey stacks, so they
+    # are only created on first use to keep the menu bar icon fast to appear.
+
+    @functools.cached_property
+    def recording_controller(self) -> "RecordingController":
+        """Get the recording controller, creating it on first access.
+
+        If run() has started building it in the background, this waits for
+        that instead of building a second one.
+        """
+        if self._recording_controller_future is not None:
+            return self._recording_controller_future.result()
+        return self._create_recording_controller()
+
+    def _create_recording_controller(self) -> "RecordingController":
+        """Import and build the recording controller."""
+        from recall.app.recording import RecordingController
+
+        return RecordingController(output_dir=self._output_dir)
+
+    def _preload_subsystems(self) -> None:
+        """Start building the recording controller on a worker thread.
+
+        Importing the recording stack is the slow part of the first
+        recording, so it is done while the app sits idle after launch.
+        Nothing here touches AppKit.
+        """
+        if "recording_controller" in self.__dict__ or self._recording_controller_future:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recall-preload")
+        self._recording_controller_future = executor.submit(self._create_recording_controller)
+        executor.shutdown(wait=False)
+
+    @functools.cached_property
+    def notification_manager(self) -> "NotificationManager":
+        """Get the notification manager, creating it on first access."""
+        from recall.app.notifications import NotificationManager
+
+        return NotificationManager(
+            coalesce_window=NOTIFICATION_COALESCE_WINDOW, run_on_main=self._run_on_main
+        )
+
+    @functools.cached_property
+    def auto_recording_config(self) -> "AutoRecordingConfig":
+        """Get the auto-recording configuration, creating it on first access."""
+        from recall.app.notifications import AutoRecordingConfig
+
+        return AutoRecordingConfig()
+
+    @functools.cached_property
+    def hotkey_config(self) -> "HotkeyConfig":
+        """Get the hotkey configuration, creating it on first access."""
+        from recall.app.hotkeys import HotkeyConfig
+
+        return HotkeyConfig()
+
+    @functools.cached_property
+    def hotkey_manager(self) -> "HotkeyManager":
+        """Get the hotkey manager, creating it and wiring its callbacks on first access."""
+        from recall.app.hotkeys import HotkeyManager
+
+        # Under rumps the hotkeys are read on the main run loop, so their
+        # callbacks already arrive on the main thread.
+        manager = HotkeyManager(self.hotkey_config, use_main_run_loop=self._rumps_app is not None)
+        self._setup_hotkey_callbacks(manager)
+        return manager
 
     @property
     def state(self) -> AppState:
@@ -149,12 +241,11 @@ class RecallMenuBar:
     @property
     def recording_duration(self) -> Optional[float]:
         """Get the current recording duration in seconds."""
-        # Use controller's duration if available
-        if self.recording_controller:
-            return self.recording_controller.get_duration()
-        if self._recording_start_time is None:
+        # Nothing can be recording before the controller exists, so don't
+        # build it just to answer this
+        if "recording_controller" not in self.__dict__:
             return None
-        return time.time() - self._recording_start_time
+        return self.recording_controller.get_duration()
 
     def set_state(self, state: AppState) -> None:
         """Set the application state and update UI.
@@ -162,115 +253,105 @@ class RecallMenuBar:
         Args:
             state: The new application state
         """
+        if state is self._state:
+            return
+
         self._state = state
         self._icon = state.icon
 
-        if RUMPS_AVAILABLE and self._rumps_app:
-            self._rumps_app.title = self._icon
-            self._update_rumps_menu()
+        # Transitions that arrive before a queued refresh has run are
+        # coalesced into it, since the refresh reads the latest state.
+        if self._rumps_app is not None and not self._ui_refresh_pending:
+            self._ui_refresh_pending = True
+            self._run_on_main(self._refresh_rumps_ui)
 
-    def get_menu_items(self) -> List[MenuItem]:
-        """Get the list of menu items based on current state.
+    def get_menu_items(self) -> tuple[MenuItem, ...]:
+        """Get the menu items based on current state.
+
+        Only the recording toggle depends on the state; the tuple for each
+        state is built at import time and shared.
 
         Returns:
-            List of MenuItem objects for the dropdown menu.
+            Tuple of MenuItem objects for the dropdown menu.
         """
-        items = []
-
-        # Recording toggle
-        if self._state == AppState.RECORDING:
-            items.append(
-                MenuItem(
-                    title="Stop Recording",
-                    callback="on_stop_recording",
-                    key="r",
-                )
-            )
-        elif self._state == AppState.PROCESSING:
-            items.append(
-                MenuItem(
-                    title="Processing...",
-                    callback="on_start_recording",
-                    enabled=False,
-                )
-            )
-        else:
-            items.append(
-                MenuItem(
-                    title="Start Recording",
-                    callback="on_start_recording",
-                    key="r",
-                )
-            )
-
-        # Notes
-        items.append(
-            MenuItem(
-                title="Quick Note...",
-                callback="on_quick_note",
-                key="n",
-            )
-        )
-        items.append(
-            MenuItem(
-                title="Voice Note",
-                callback="on_voice_note",
-                key="v",
-            )
-        )
-
-        items.append(MenuItem.separator())
-
-        # Search and Library
-        items.append(
-            MenuItem(
-                title="Search...",
-                callback="on_search",
-                key="s",
-            )
-        )
-        items.append(
-            MenuItem(
-                title="Open Library",
-                callback="on_open_library",
-            )
-        )
-
-        items.append(MenuItem.separator())
-
-        # Settings and Quit
-        items.append(
-            MenuItem(
-                title="Settings...",
-                callback="on_settings",
-                key=",",
-            )
-        )
-        items.append(
-            MenuItem(
-                title="Quit",
-                callback="on_quit",
-                key="q",
-            )
-        )
-
-        return items
+        return _MENU_ITEMS_BY_STATE[self._state]
 
     # ========================================================================
     # Callback Methods
     # ========================================================================
 
     def on_start_recording(self, sender) -> None:
-        """Handle Start Recording action."""
+        """Handle Start Recording action.
+
+        Ignored unless the app is idle, so a hotkey and a menu click landing
+        together cannot start a second recorder.
+        """
+        if self._state != AppState.IDLE:
+            return
+
         status = self.recording_controller.start_recording()
         self.set_state(status.state)
 
     def on_stop_recording(self, sender) -> None:
-        """Handle Stop Recording action."""
+        """Handle Stop Recording action.
+
+        Stopping the recorder and running the ingestion pipeline can take
+        minutes, so both happen on a worker thread. The app stays in the
+        PROCESSING state until the result is posted back to the main thread.
+        Ignored unless a recording is running, so a duplicate stop does not
+        queue a second ingestion job.
+        """
+        if self._state != AppState.RECORDING:
+            return
+
         self.set_state(AppState.PROCESSING)
-        # TODO: Stop recorder and trigger ingestion pipeline
-        # For now, just reset to idle after "processing"
-        # In real implementation, this would be async
+        self._ingest_executor.submit(self._stop_and_process_recording)
+
+    def _stop_and_process_recording(self) -> None:
+        """Stop the recorder and ingest the audio (runs on the worker thread).
+
+        The executor would swallow an exception raised here, so errors are
+        logged and reported, and the app always returns to IDLE.
+        """
+        try:
+            controller = self.recording_controller
+            stop_status = controller.stop_recording()
+
+            recordings: list["Recording"] = []
+            status = stop_status
+            if stop_status.audio_path is not None:
+                status = controller.process_recording(
+                    stop_status.audio_path, on_complete=recordings.append
+                )
+
+            # Posting a notification can take a few milliseconds, so it is sent
+            # from here; only the state change goes back to the main thread.
+            self._notify_processing_result(
+                status, stop_status.duration_seconds, recordings[0] if recordings else None
+            )
+        except Exception as e:
+            logger.exception("Failed to stop and process recording")
+            self.notification_manager.notify_error(str(e))
+        finally:
+            self._run_on_main(self.set_state, AppState.IDLE)
+
+    def _notify_processing_result(
+        self, status: "RecordingStatus", duration: float, recording: Optional["Recording"]
+    ) -> None:
+        """Report the outcome of a processed recording.
+
+        Args:
+            status: Final RecordingStatus from the controller.
+            duration: Length of the recording in seconds.
+            recording: The ingested Recording, or None if ingestion failed.
+        """
+        if status.error:
+            self.notification_manager.notify_error(status.error)
+        elif recording is not None:
+            self.notification_manager.notify_recording_saved(
+                title=recording.title or "Recording",
+                duration=int(duration),
+            )
 
     def on_quick_note(self, sender) -> None:
         """Handle Quick Note action."""
@@ -288,9 +369,23 @@ class RecallMenuBar:
         pass
 
     def on_open_library(self, sender) -> None:
-        """Handle Open Library action."""
-        # TODO: Open Finder to recordings folder
-        pass
+        """Handle Open Library action by showing the recordings folder in Finder.
+
+        The folder is opened through NSWorkspace directly rather than by
+        running /usr/bin/open, so no process is spawned from the UI thread.
+        The path comes from the app's settings, so the recording stack is not
+        loaded just to show a folder.
+        """
+        if self._rumps_app is None:
+            return
+
+        library = self._output_dir or DEFAULT_RECORDINGS_DIR
+        library.mkdir(parents=True, exist_ok=True)
+
+        from AppKit import NSWorkspace  # type: ignore
+        from Foundation import NSURL  # type: ignore
+
+        NSWorkspace.sharedWorkspace().openURL_(NSURL.fileURLWithPath_(str(library)))
 
     def on_settings(self, sender) -> None:
         """Handle Settings action."""
@@ -298,9 +393,23 @@ class RecallMenuBar:
         pass
 
     def on_quit(self, sender) -> None:
-        """Handle Quit action."""
+        """Handle Quit action.
+
+        An ingestion still running on the worker would be lost by quitting
+        right away, but waiting for it here would freeze the menu. The quit
+        is instead queued on the worker behind any pending ingestion and
+        posted back to the main thread from there.
+        """
+        if self._quit_requested:
+            return
+
         self._quit_requested = True
-        if RUMPS_AVAILABLE:
+        self._ingest_executor.submit(self._run_on_main, self._quit_application)
+        self._ingest_executor.shutdown(wait=False)
+
+    def _quit_application(self) -> None:
+        """Quit the rumps application (runs on the main thread)."""
+        if self._rumps_app is not None:
             rumps.quit_application()
 
     # ========================================================================
@@ -308,18 +417,57 @@ class RecallMenuBar:
     # ========================================================================
 
     def _setup_rumps_menu(self) -> None:
-        """Set up the rumps menu items."""
-        if not RUMPS_AVAILABLE or not self._rumps_app:
+        """Set up the rumps menu items.
+
+        This is the only place the menu is built; later state changes go
+        through _update_rumps_menu().
+        """
+        if self._rumps_app is None:
             return
 
-        self._update_rumps_menu()
+        menu_items = self.get_menu_items()
+        rumps_items = []
+        for item in menu_items:
+            if item.is_separator:
+                rumps_items.append(rumps.separator)
+            else:
+                rumps_items.append(
+                    rumps.MenuItem(
+                        title=item.title,
+                        callback=MethodType(item.callback, self) if item.enabled else None,
+                        key=item.key or "",
+                    )
+                )
+
+        self._rumps_app.menu.clear()
+        self._rumps_app.menu.update(rumps_items)
+
+        self._recording_menu_item = rumps_items[0]
+        self._shown_recording_item = menu_items[0]
+
+    def _setup_hotkey_callbacks(self, manager: "HotkeyManager") -> None:
+        """Set up callbacks for hotkey events.
+
+        Args:
+            manager: The hotkey manager to wire up.
+        """
+        # The manager is owned by the app, so the callbacks only hold a weak
+        # reference back to it to avoid a reference cycle.
+        app_ref = weakref.ref(self)
+        cls = type(self)
+
+        def dispatch(func: Callable[..., None], *args: Any) -> Callable[[], None]:
+            def callback() -> None:
+                app = app_ref()
+                if app is not None:
+                    app._run_on_main(func, app, *args)
 
-    def _setup_hotkey_callbacks(self) -> None:
-        """Set up callbacks for hotkey events."""
-        self.hotkey_manager.on_toggle_recording = self._toggle_recording
-        self.hotkey_manager.on_quick_note = lambda: self.on_quick_note(None)
-        self.hotkey_manager.on_voice_note = lambda: self.on_voice_note(None)
-        self.hotkey_manager.on_open_search = lambda: self.on_search(None)
+            return callback
+
+        manager.on_toggle_recording = dispatch(cls._toggle_recording)
+        manager.on_quick_note = dispatch(cls.on_quick_note, None)
+        manager.on_voice_note = dispatch(cls.on_voice_note, None)
+        manager.on_open_search = dispatch(cls.on_search, None)
 
     def _setup_hotkeys(self) -> None:
         """Start the hotkey listener."""
@@ -332,27 +480,64 @@ class RecallMenuBar:
         else:
             self.on_start_recording(None)
 
+    def _run_on_main(self, func: Callable[..., None], *args: Any) -> None:
+        """Run a UI action on the main thread.
+
+        AppKit objects may only be touched from the main thread, but hotkey
+        callbacks arrive on the listener thread. Calls from other threads are
+        posted to the main run loop as they happen, so nothing polls for them
+        while the app is idle.
+
+        Args:
+            func: The callable to run.
+            *args: Positional arguments for the callable.
+        """
+        if self._rumps_app is None or threading.current_thread() is self._main_thread:
+            func(*args)
+        else:
+            from PyObjCTools import AppHelper  # type: ignore
+
+            AppHelper.callAfter(func, *args)
+
+    def _refresh_rumps_ui(self) -> None:
+        """Push the current state to the rumps title and menu."""
+        self._ui_refresh_pending = False
+
+        # While recording, the title also shows the elapsed time; it is
+        # redrawn once a second by the duration timer and not otherwise.
+        if self._state == AppState.RECORDING:
+            self._tick_duration_title()
+            if not self._duration_timer.is_alive():
+                self._duration_timer.start()
+        else:
+            if self._duration_timer.is_alive():
+                self._duration_timer.stop()
+            self._rumps_app.title = self._icon
+
+        self._update_rumps_menu()
+
+    def _tick_duration_title(self, sender=None) -> None:
+        """Show the icon and elapsed recording time as the menu bar title."""
+        duration = self.recording_controller.get_formatted_duration()
+        self._rumps_app.title = f"{self._icon} {duration}"
+
     def _update_rumps_menu(self) -> None:
-        """Update the rumps menu to match current state."""
-        if not RUMPS_AVAILABLE or not self._rumps_app:
+        """Update the rumps menu to match current state.
+
+        Only the recording toggle changes between states, so it is patched
+        in place rather than rebuilding the menu.
+        """
+        if self._recording_menu_item is None:
             return
 
-        menu_items = self.get_menu_items()
-        self._rumps_app.menu.clear()
+        item = _RECORDING_ITEMS[self._state]
+        if item is self._shown_recording_item:
+            return
 
-        for item in menu_items:
-            if item.is_separator:
-                self._rumps_app.menu.add(rumps.separator)
-            else:
-                callback = getattr(self, item.callback, None)
-                rumps_item = rumps.MenuItem(
-                    title=item.title,
-                    callback=callback,
-                    key=item.key or "",
-                )
-                if not item.enabled:
-                    rumps_item.set_callback(None)
-                self._rumps_app.menu.add(rumps_item)
+        self._recording_menu_item.title = item.title
+        callback = MethodType(item.callback, self) if item.enabled else None
+        self._recording_menu_item.set_callback(callback, key=item.key or "")
+        self._shown_recording_item = item
 
     def run(self) -> None:
         """Run the menu bar application.
@@ -360,7 +545,9 @@ class RecallMenuBar:
         On macOS, this starts the rumps event loop.
         On other platforms, this prints a warning.
         """
-        if RUMPS_AVAILABLE and self._rumps_app:
+        if self._rumps_app is not None:
+            self._setup_hotkeys()
+            self._preload_subsystems()
             self._rumps_app.run()
         else:
             print("⚠️  Menu bar app requires macOS with rumps installed.")
@@ -368,6 +555,36 @@ class RecallMenuBar:
             print("   Running in mock mode for testing.")
 
 
+_RECORDING_ITEMS = {
+    AppState.IDLE: MenuItem(
+        title="Start Recording", callback=RecallMenuBar.on_start_recording, key="r"
+    ),
+    AppState.RECORDING: MenuItem(
+        title="Stop Recording", callback=RecallMenuBar.on_stop_recording, key="r"
+    ),
+    AppState.PROCESSING: MenuItem(
+        title="Processing...", callback=RecallMenuBar.on_start_recording, enabled=False
+    ),
+}
+
+_STATIC_ITEMS = (
+    # Notes
+    MenuItem(title="Quick Note...", callback=RecallMenuBar.on_quick_note, key="n"),
+    MenuItem(title="Voice Note", callback=RecallMenuBar.on_voice_note, key="v"),
+    MenuItem.separator(),
+    # Search and Library
+    MenuItem(title="Search...", callback=RecallMenuBar.on_search, key="s"),
+    MenuItem(title="Open Library", callback=RecallMenuBar.on_open_library),
+    MenuItem.separator(),
+    # Settings and Quit
+    MenuItem(title="Settings...", callback=RecallMenuBar.on_settings, key=","),
+    MenuItem(title="Quit", callback=RecallMenuBar.on_quit, key="q"),
+)
+
+
+_MENU_ITEMS_BY_STATE = {state: (_RECORDING_ITEMS[state], *_STATIC_ITEMS) for state in AppState}
+
+
 def main() -> None:
     """Entry point for the menu bar application."""
     app = RecallMenuBar()
@@ -7,8 +7,10 @@ This module provides:
 """
 
 import logging
+import threading
+from collections.abc import MutableSet
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Set, Tuple
 
 # Check if rumps is available (macOS only)
 try:
@@ -23,16 +25,23 @@ logger = logging.getLogger(__name__)
 
 
 # Default meeting apps to whitelist for auto-recording
-DEFAULT_MEETING_APPS = [
-    "zoom.us",
-    "Microsoft Teams",
-    "Slack",
-    "Discord",
-    "Google Meet",
-    "Webex",
-    "Skype",
-    "FaceTime",
-]
+DEFAULT_MEETING_APPS = frozenset(
+    {
+        "zoom.us",
+        "Microsoft Teams",
+        "Slack",
+        "Discord",
+        "Google Meet",
+        "Webex",
+        "Skype",
+        "FaceTime",
+    }
+)
+
+
+def _call_now(func: Callable[..., None], *args: Any) -> None:
+    """Run func right away on the calling thread."""
+    func(*args)
 
 
 class NotificationManager:
@@ -40,15 +49,34 @@ class NotificationManager:
 
     This class provides a unified interface for sending notifications,
     with special methods for recording-related events.
+
+    With a non-zero coalesce window, notifications are held briefly and
+    identical ones (same title, subtitle and message) are merged, so
+    near-simultaneous triggers for the same event show a single banner.
     """
 
-    def __init__(self, enabled: bool = True) -> None:
+    def __init__(
+        self,
+        enabled: bool = True,
+        coalesce_window: float = 0.0,
+        run_on_main: Optional[Callable[..., None]] = None,
+    ) -> None:
         """Initialize the notification manager.
 
         Args:
             enabled: Whether notifications are enabled.
+            coalesce_window: Seconds to hold notifications so that identical
+                ones are merged. 0 delivers every notification immediately.
+            run_on_main: Called as run_on_main(func, *args) to run func on the
+                main thread, where notifications must be posted. By default
+                they are posted from the calling thread.
         """
         self.enabled = enabled
+        self.coalesce_window = coalesce_window
+        self._run_on_main = run_on_main or _call_now
+        self._pending: Dict[Tuple[str, str, str], bool] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
 
     def send(
         self,
@@ -68,16 +96,43 @@ class NotificationManager:
         if not self.enabled:
             return
 
-        if rumps is not None:
-            rumps.notification(
-                title=title,
-                subtitle=subtitle,
-                message=message,
-                sound=sound,
-            )
-        else:
+        if rumps is None:
             # Log as fallback when rumps unavailable
             logger.info(f"Notification: {title} - {message}")
+        elif self.coalesce_window <= 0:
+            self._run_on_main(self._deliver, title, subtitle, message, sound)
+        else:
+            with self._pending_lock:
+                key = (title, subtitle, message)
+                self._pending[key] = self._pending.get(key, False) or sound
+                if self._flush_timer is None:
+                    # A thread timer, since notifications are also sent from
+                    # worker threads; the flush itself runs on the main thread
+                    self._flush_timer = threading.Timer(
+                        self.coalesce_window, self._run_on_main, args=(self.flush,)
+                    )
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Deliver any notifications held for coalescing."""
+        with self._pending_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            pending, self._pending = self._pending, {}
+
+        for (title, subtitle, message), sound in pending.items():
+            self._deliver(title, subtitle, message, sound)
+
+    def _deliver(self, title: str, subtitle: str, message: str, sound: bool) -> None:
+        """Post a notification through rumps."""
+        rumps.notification(
+            title=title,
+            subtitle=subtitle,
+            message=message,
+            sound=sound,
+        )
 
     def notify_recording_started(self, source: str = "microphone") -> None:
         """Send notification when recording starts.
@@ -143,6 +198,62 @@ class NotificationManager:
         )
 
 
+class AppWhitelist(MutableSet):
+    """Set of application names with case-insensitive lookups.
+
+    A case-folded index is kept in step with the names as given, so checking
+    a detected app is a single hash lookup however the set was changed.
+    """
+
+    def __init__(self, apps: Iterable[str] = ()) -> None:
+        """Initialize the whitelist.
+
+        Args:
+            apps: Application names to start with.
+        """
+        self._apps: Set[str] = set()
+        self._folded: Dict[str, Set[str]] = {}
+        for app in apps:
+            self.add(app)
+
+    def __contains__(self, app: object) -> bool:
+        return app in self._apps
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._apps)
+
+    def __len__(self) -> int:
+        return len(self._apps)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({sorted(self._apps)!r})"
+
+    def add(self, app: str) -> None:
+        """Add an application name, keeping its spelling."""
+        if app not in self._apps:
+            self._apps.add(app)
+            self._folded.setdefault(app.casefold(), set()).add(app)
+
+    def discard(self, app: str) -> None:
+        """Remove an application name if present, matching case exactly."""
+        if app in self._apps:
+            self._apps.discard(app)
+            folded = app.casefold()
+            spellings = self._folded[folded]
+            spellings.discard(app)
+            if not spellings:
+                del self._folded[folded]
+
+    def contains_casefolded(self, app_name: str) -> bool:
+        """Check for an application name, ignoring case."""
+        return app_name.casefold() in self._folded
+
+    def discard_casefolded(self, app_name: str) -> None:
+        """Remove every spelling of an application name, ignoring case."""
+        for app in self._folded.pop(app_name.casefold(), ()):
+            self._apps.discard(app)
+
+
 @dataclass
 class AutoRecordingConfig:
     """Configuration for auto-recording triggers.
@@ -151,13 +262,22 @@ class AutoRecordingConfig:
         enabled: Whether auto-recording is enabled (off by default for privacy).
         detect_meeting_apps: Whether to detect meeting applications.
         detect_system_audio: Whether to detect system audio via BlackHole.
-        app_whitelist: List of application names to trigger auto-recording.
+        app_whitelist: Set of application names to trigger auto-recording.
+            Matching is case-insensitive. Any iterable of names, such as a
+            list, is accepted and stored as an AppWhitelist.
     """
 
     enabled: bool = False
     detect_meeting_apps: bool = True
     detect_system_audio: bool = True
-    app_whitelist: List[str] = field(default_factory=lambda: DEFAULT_MEETING_APPS.copy())
+    app_whitelist: AppWhitelist = field(default_factory=lambda: AppWhitelist(DEFAULT_MEETING_APPS))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Convert on every assignment, not just in __init__, so the
+        # case-folded index can't be bypassed by replacing the whitelist
+        if name == "app_whitelist" and not isinstance(value, AppWhitelist):
+            value = AppWhitelist(value)
+        super().__setattr__(name, value)
 
     def add_to_whitelist(self, app_name: str) -> None:
         """Add an application to the whitelist.
@@ -165,28 +285,28 @@ class AutoRecordingConfig:
         Args:
             app_name: The application name to add.
         """
-        if app_name not in self.app_whitelist:
-            self.app_whitelist.append(app_name)
+        self.app_whitelist.add(app_name)
 
     def remove_from_whitelist(self, app_name: str) -> None:
         """Remove an application from the whitelist.
 
+        Entries differing from ``app_name`` only in case are removed too.
+
         Args:
             app_name: The application name to remove.
         """
-        if app_name in self.app_whitelist:
-            self.app_whitelist.remove(app_name)
+        self.app_whitelist.discard_casefolded(app_name)
 
     def is_app_whitelisted(self, app_name: str) -> bool:
         """Check if an application is whitelisted.
 
         Args:
-            app_name: The application name to check.
+            app_name: The application name to check, in any case.
 
         Returns:
             True if the app is in the whitelist.
         """
-        return app_name in self.app_whitelist
+        return self.app_whitelist.contains_casefolded(app_name)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AutoRecordingConfig":
@@ -198,11 +318,12 @@ class AutoRecordingConfig:
         Returns:
             AutoRecordingConfig instance.
         """
+        whitelist = data.get("app_whitelist")
         return cls(
             enabled=data.get("enabled", False),
             detect_meeting_apps=data.get("detect_meeting_apps", True),
             detect_system_audio=data.get("detect_system_audio", True),
-            app_whitelist=data.get("app_whitelist", DEFAULT_MEETING_APPS.copy()),
+            app_whitelist=DEFAULT_MEETING_APPS if whitelist is None else whitelist,
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -215,7 +336,7 @@ class AutoRecordingConfig:
             "enabled": self.enabled,
             "detect_meeting_apps": self.detect_meeting_apps,
             "detect_system_audio": self.detect_system_audio,
-            "app_whitelist": self.app_whitelist,
+            "app_whitelist": sorted(self.app_whitelist),
         }
 
 
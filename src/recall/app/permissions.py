@@ -9,21 +9,29 @@ This module provides:
 
 import platform
 import subprocess
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, replace
 from enum import Enum
 from typing import Callable
 
 # Check if running on macOS
 MACOS_AVAILABLE = platform.system() == "Darwin"
 
-# Try to import macOS-specific modules
+# Try to import macOS-specific modules once, so permission checks don't re-import them
+_AVFoundation = None
+_Quartz = None
 if MACOS_AVAILABLE:
     try:
-        import AVFoundation  # type: ignore  # noqa: F401
+        import AVFoundation as _AVFoundation  # type: ignore
 
         AVFOUNDATION_AVAILABLE = True
     except ImportError:
         AVFOUNDATION_AVAILABLE = False
+
+    try:
+        import Quartz as _Quartz  # type: ignore
+    except ImportError:
+        pass
 else:
     AVFOUNDATION_AVAILABLE = False
 
@@ -45,7 +53,25 @@ class PermissionStatus(Enum):
     RESTRICTED = "restricted"
 
 
-@dataclass
+# AVAuthorizationStatus values mapped to our enum
+_AV_AUDIO_STATUS_MAP = {
+    0: PermissionStatus.NOT_DETERMINED,  # AVAuthorizationStatusNotDetermined
+    1: PermissionStatus.RESTRICTED,  # AVAuthorizationStatusRestricted
+    2: PermissionStatus.DENIED,  # AVAuthorizationStatusDenied
+    3: PermissionStatus.GRANTED,  # AVAuthorizationStatusAuthorized
+}
+
+# Summary markers for each permission status and for required/optional permissions
+_STATUS_ICON = {
+    PermissionStatus.GRANTED: "✓",
+    PermissionStatus.DENIED: "✗",
+    PermissionStatus.NOT_DETERMINED: "?",
+    PermissionStatus.RESTRICTED: "⊘",
+}
+_REQUIRED_LABEL = {True: "(required)", False: "(optional)"}
+
+
+@dataclass(frozen=True, slots=True)
 class PermissionInfo:
     """Information about a permission."""
 
@@ -119,8 +145,11 @@ def get_preferences_url(permission_type: PermissionType) -> str:
 class PermissionManager:
     """Manages macOS permissions for Recall."""
 
-    # Permission definitions
-    PERMISSIONS = [
+    # Seconds a checked permission status is reused before probing macOS again
+    CACHE_TTL = 2.0
+
+    # Permission definitions; get_all_permissions copies these with the current status
+    PERMISSIONS = (
         PermissionInfo(
             permission_type=PermissionType.MICROPHONE,
             status=PermissionStatus.NOT_DETERMINED,
@@ -142,12 +171,13 @@ class PermissionManager:
             required=False,  # Only needed for system audio
             instructions=PERMISSION_INSTRUCTIONS[PermissionType.SCREEN_RECORDING],
         ),
-    ]
+    )
 
     def __init__(self):
         """Initialize permission manager."""
         self._callbacks: list[Callable[[PermissionType, PermissionStatus], None]] = []
         self._cached_status: dict[PermissionType, PermissionStatus] = {}
+        self._cached_at: dict[PermissionType, float] = {}
 
     def get_all_permissions(self) -> list[PermissionInfo]:
         """Get all permission info with current status.
@@ -155,19 +185,10 @@ class PermissionManager:
         Returns:
             List of PermissionInfo with current status.
         """
-        permissions = []
-        for perm in self.PERMISSIONS:
-            status = self.check_permission(perm.permission_type)
-            permissions.append(
-                PermissionInfo(
-                    permission_type=perm.permission_type,
-                    status=status,
-                    description=perm.description,
-                    required=perm.required,
-                    instructions=perm.instructions,
-                )
-            )
-        return permissions
+        return [
+            replace(perm, status=self.check_permission(perm.permission_type))
+            for perm in self.PERMISSIONS
+        ]
 
     def check_permission(self, permission_type: PermissionType) -> PermissionStatus:
         """Check the status of a permission.
@@ -181,14 +202,29 @@ class PermissionManager:
         if not MACOS_AVAILABLE:
             return PermissionStatus.NOT_DETERMINED
 
+        # Permissions change on human timescales, so reuse a recent probe result
+        now = time.monotonic()
+        cached_at = self._cached_at.get(permission_type)
+        if cached_at is not None and now - cached_at < self.CACHE_TTL:
+            return self._cached_status[permission_type]
+
         if permission_type == PermissionType.MICROPHONE:
-            return self._check_microphone_permission()
+            status = self._check_microphone_permission()
         elif permission_type == PermissionType.ACCESSIBILITY:
-            return self._check_accessibility_permission()
+            status = self._check_accessibility_permission()
         elif permission_type == PermissionType.SCREEN_RECORDING:
-            return self._check_screen_recording_permission()
+            status = self._check_screen_recording_permission()
+        else:
+            return PermissionStatus.NOT_DETERMINED
 
-        return PermissionStatus.NOT_DETERMINED
+        self._cached_status[permission_type] = status
+        self._cached_at[permission_type] = now
+        return status
+
+    def invalidate_cache(self) -> None:
+        """Forget cached permission statuses so the next check probes macOS."""
+        self._cached_status.clear()
+        self._cached_at.clear()
 
     def _check_microphone_permission(self) -> PermissionStatus:
         """Check microphone permission on macOS.
@@ -200,20 +236,10 @@ class PermissionManager:
             return PermissionStatus.NOT_DETERMINED
 
         try:
-            import AVFoundation  # type: ignore
-
-            auth_status = AVFoundation.AVCaptureDevice.authorizationStatusForMediaType_(
-                AVFoundation.AVMediaTypeAudio
+            auth_status = _AVFoundation.AVCaptureDevice.authorizationStatusForMediaType_(
+                _AVFoundation.AVMediaTypeAudio
             )
-
-            # Map AVFoundation status to our enum
-            status_map = {
-                0: PermissionStatus.NOT_DETERMINED,  # AVAuthorizationStatusNotDetermined
-                1: PermissionStatus.RESTRICTED,  # AVAuthorizationStatusRestricted
-                2: PermissionStatus.DENIED,  # AVAuthorizationStatusDenied
-                3: PermissionStatus.GRANTED,  # AVAuthorizationStatusAuthorized
-            }
-            return status_map.get(auth_status, PermissionStatus.NOT_DETERMINED)
+            return _AV_AUDIO_STATUS_MAP.get(auth_status, PermissionStatus.NOT_DETERMINED)
         except Exception:
             return PermissionStatus.NOT_DETERMINED
 
@@ -223,12 +249,13 @@ class PermissionManager:
         Returns:
             Permission status.
         """
-        try:
-            import Quartz  # type: ignore
+        if _Quartz is None:
+            return PermissionStatus.NOT_DETERMINED
 
+        try:
             # Check if we have accessibility permissions
-            trusted = Quartz.AXIsProcessTrustedWithOptions(
-                {Quartz.kAXTrustedCheckOptionPrompt: False}
+            trusted = _Quartz.AXIsProcessTrustedWithOptions(
+                {_Quartz.kAXTrustedCheckOptionPrompt: False}
             )
             return PermissionStatus.GRANTED if trusted else PermissionStatus.DENIED
         except Exception:
@@ -240,12 +267,19 @@ class PermissionManager:
         Returns:
             Permission status.
         """
-        try:
-            import Quartz  # type: ignore
+        if _Quartz is None:
+            return PermissionStatus.NOT_DETERMINED
 
-            # Try to capture a small region - this will fail if no permission
-            display_id = Quartz.CGMainDisplayID()
-            image = Quartz.CGDisplayCreateImage(display_id)
+        try:
+            # macOS 10.15+ has a cheap preflight check that doesn't capture the screen
+            if hasattr(_Quartz, "CGPreflightScreenCaptureAccess"):
+                if _Quartz.CGPreflightScreenCaptureAccess():
+                    return PermissionStatus.GRANTED
+                return PermissionStatus.DENIED
+
+            # Older macOS: try to capture the display - this will fail if no permission
+            display_id = _Quartz.CGMainDisplayID()
+            image = _Quartz.CGDisplayCreateImage(display_id)
             if image is not None:
                 return PermissionStatus.GRANTED
             return PermissionStatus.DENIED
@@ -264,14 +298,15 @@ class PermissionManager:
         if not MACOS_AVAILABLE:
             return PermissionStatus.NOT_DETERMINED
 
+        # The user may change the permission in response to the request
+        self.invalidate_cache()
+
         if permission_type == PermissionType.MICROPHONE:
             return self._request_microphone_permission()
         elif permission_type == PermissionType.ACCESSIBILITY:
             return self._request_accessibility_permission()
         elif permission_type == PermissionType.SCREEN_RECORDING:
-            # Screen recording doesn't have a direct request API
-            self.open_system_preferences(permission_type)
-            return PermissionStatus.NOT_DETERMINED
+            return self._request_screen_recording_permission()
 
         return PermissionStatus.NOT_DETERMINED
 
@@ -285,16 +320,14 @@ class PermissionManager:
             return PermissionStatus.NOT_DETERMINED
 
         try:
-            import AVFoundation  # type: ignore
-
             # This will trigger the permission dialog
             result = [PermissionStatus.NOT_DETERMINED]
 
             def handler(granted: bool) -> None:
                 result[0] = PermissionStatus.GRANTED if granted else PermissionStatus.DENIED
 
-            AVFoundation.AVCaptureDevice.requestAccessForMediaType_completionHandler_(
-                AVFoundation.AVMediaTypeAudio, handler
+            _AVFoundation.AVCaptureDevice.requestAccessForMediaType_completionHandler_(
+                _AVFoundation.AVMediaTypeAudio, handler
             )
 
             return result[0]
@@ -307,15 +340,35 @@ class PermissionManager:
         Returns:
             Current permission status.
         """
-        try:
-            import Quartz  # type: ignore
+        if _Quartz is None:
+            return PermissionStatus.NOT_DETERMINED
 
+        try:
             # This will show a prompt to the user
-            Quartz.AXIsProcessTrustedWithOptions({Quartz.kAXTrustedCheckOptionPrompt: True})
+            _Quartz.AXIsProcessTrustedWithOptions({_Quartz.kAXTrustedCheckOptionPrompt: True})
             return self._check_accessibility_permission()
         except Exception:
             return PermissionStatus.NOT_DETERMINED
 
+    def _request_screen_recording_permission(self) -> PermissionStatus:
+        """Request screen recording permission.
+
+        Returns:
+            New permission status.
+        """
+        if _Quartz is not None and hasattr(_Quartz, "CGRequestScreenCaptureAccess"):
+            try:
+                # This will show a prompt to the user the first time it is called
+                if _Quartz.CGRequestScreenCaptureAccess():
+                    return PermissionStatus.GRANTED
+                return PermissionStatus.DENIED
+            except Exception:
+                return PermissionStatus.NOT_DETERMINED
+
+        # Older macOS has no direct request API
+        self.open_system_preferences(PermissionType.SCREEN_RECORDING)
+        return PermissionStatus.NOT_DETERMINED
+
     def open_system_preferences(self, permission_type: PermissionType) -> bool:
         """Open System Preferences to the relevant pane.
 
@@ -330,7 +383,13 @@ class PermissionManager:
 
         url = get_preferences_url(permission_type)
         try:
-            subprocess.run(["open", url], check=True)
+            # Don't wait for `open` to exit; launching System Settings can take a while
+            subprocess.Popen(
+                ["open", url],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
             return True
         except Exception:
             return False
@@ -353,7 +412,13 @@ class PermissionManager:
         Returns:
             True if all required permissions are granted.
         """
-        return len(self.get_missing_permissions()) == 0
+        for perm in self.PERMISSIONS:
+            if (
+                perm.required
+                and self.check_permission(perm.permission_type) != PermissionStatus.GRANTED
+            ):
+                return False
+        return True
 
     def add_callback(self, callback: Callable[[PermissionType, PermissionStatus], None]) -> None:
         """Add a callback for permission status changes.
@@ -369,8 +434,10 @@ class PermissionManager:
         Args:
             callback: Previously added callback to remove.
         """
-        if callback in self._callbacks:
+        try:
             self._callbacks.remove(callback)
+        except ValueError:
+            pass
 
     def _notify_callbacks(self, permission_type: PermissionType, status: PermissionStatus) -> None:
         """Notify all callbacks of a permission change.
@@ -379,6 +446,9 @@ class PermissionManager:
             permission_type: Type of permission that changed.
             status: New status.
         """
+        if not self._callbacks:
+            return
+
         for callback in self._callbacks:
             try:
                 callback(permission_type, status)
@@ -394,24 +464,18 @@ class PermissionManager:
         lines = ["Permission Status:"]
         lines.append("-" * 40)
 
-        for perm in self.get_all_permissions():
-            status_icon = {
-                PermissionStatus.GRANTED: "✓",
-                PermissionStatus.DENIED: "✗",
-                PermissionStatus.NOT_DETERMINED: "?",
-                PermissionStatus.RESTRICTED: "⊘",
-            }.get(perm.status, "?")
-
-            required_text = "(required)" if perm.required else "(optional)"
+        all_perms = self.get_all_permissions()
+        for perm in all_perms:
             lines.append(
-                f"{status_icon} {perm.permission_type.value}: {perm.status.value} {required_text}"
+                f"{_STATUS_ICON.get(perm.status, '?')} {perm.permission_type.value}: "
+                f"{perm.status.value} {_REQUIRED_LABEL[perm.required]}"
             )
 
         lines.append("-" * 40)
-        if self.all_permissions_granted():
+        missing = [p for p in all_perms if p.required and p.status != PermissionStatus.GRANTED]
+        if not missing:
             lines.append("All required permissions granted.")
         else:
-            missing = self.get_missing_permissions()
             lines.append(
                 f"Missing {len(missing)} required permission(s): "
                 + ", ".join(p.permission_type.value for p in missing)
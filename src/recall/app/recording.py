@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Optional
 
-from recall.app.menubar import AppState
+from recall.app.menubar import DEFAULT_RECORDINGS_DIR, AppState
 from recall.capture.recorder import DeviceNotFoundError, Recorder
 from recall.pipeline.ingest import ingest_audio
 
@@ -53,10 +53,12 @@ class RecordingController:
             output_dir: Directory for saving recordings.
                        Defaults to ~/.recall/recordings/
         """
-        self.output_dir = output_dir or Path.home() / ".recall" / "recordings"
+        self.output_dir = output_dir or DEFAULT_RECORDINGS_DIR
         self._state = AppState.IDLE
         self._recorder: Optional[Recorder] = None
         self._recording_start_time: Optional[float] = None
+        # time.monotonic_ns() at the start, for durations unaffected by clock changes
+        self._recording_start_ns: Optional[int] = None
 
     @property
     def state(self) -> AppState:
@@ -87,6 +89,7 @@ class RecordingController:
             # Update state
             self._state = AppState.RECORDING
             self._recording_start_time = time.time()
+            self._recording_start_ns = time.monotonic_ns()
 
             return RecordingStatus(
                 state=self._state,
@@ -157,9 +160,9 @@ class RecordingController:
         Returns:
             Duration in seconds, or None if not recording.
         """
-        if self._recording_start_time is None:
+        if self._recording_start_ns is None:
             return None
-        return time.time() - self._recording_start_time
+        return (time.monotonic_ns() - self._recording_start_ns) / 1e9
 
     def get_formatted_duration(self) -> str:
         """Get the recording duration formatted as MM:SS.
@@ -199,6 +202,7 @@ class RecordingController:
             # Update state
             self._state = AppState.IDLE
             self._recording_start_time = None
+            self._recording_start_ns = None
 
             # Call completion callback
             if on_complete:
@@ -5,9 +5,10 @@ such as meeting apps (Zoom, Teams), media apps (Spotify, VLC),
 and browsers (Chrome, Firefox).
 """
 
+import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import psutil
 
@@ -71,15 +72,40 @@ KNOWN_APPS: Dict[str, tuple] = {
 }
 
 
+# Process names of meeting apps, for probing without building AudioApp objects
+_MEETING_PROCESSES = frozenset(
+    name for name, (_, category) in KNOWN_APPS.items() if category == AudioAppCategory.MEETING
+)
+
+# Seconds a process scan is reused; running apps change on human timescales
+_CACHE_TTL = 2.0
+
+# (monotonic time of the scan, detected apps), or None before the first scan
+_cache: Optional[Tuple[float, List[AudioApp]]] = None
+
+
+def _clear_cache() -> None:
+    """Forget the cached process scan so the next call rescans."""
+    global _cache
+    _cache = None
+
+
 def get_running_audio_apps() -> List[AudioApp]:
     """Get list of running audio applications.
 
     Scans running processes and identifies known audio applications
-    such as meeting apps, media players, and browsers.
+    such as meeting apps, media players, and browsers. The scan is
+    cached for a couple of seconds, so polling callers share it.
 
     Returns:
         List of AudioApp objects for detected audio applications.
     """
+    global _cache
+
+    now = time.monotonic()
+    if _cache is not None and now - _cache[0] < _CACHE_TTL:
+        return list(_cache[1])
+
     audio_apps: List[AudioApp] = []
 
     try:
@@ -93,22 +119,26 @@ def get_running_audio_apps() -> List[AudioApp]:
                 if not process_name:
                     continue
 
-                if process_name in KNOWN_APPS:
-                    display_name, category = KNOWN_APPS[process_name]
-                    audio_apps.append(
-                        AudioApp(
-                            name=display_name,
-                            process_name=process_name,
-                            category=category,
-                            pid=info.get("pid"),
-                        )
+                entry = KNOWN_APPS.get(process_name)
+                if entry is None:
+                    continue
+
+                display_name, category = entry
+                audio_apps.append(
+                    AudioApp(
+                        name=display_name,
+                        process_name=process_name,
+                        category=category,
+                        pid=info.get("pid"),
                     )
+                )
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
     except Exception:
         pass
 
-    return audio_apps
+    _cache = (now, audio_apps)
+    return list(audio_apps)
 
 
 def is_meeting_app_running() -> bool:
@@ -117,8 +147,19 @@ def is_meeting_app_running() -> bool:
     Returns:
         True if a meeting app (Zoom, Teams, etc.) is running.
     """
-    apps = get_running_audio_apps()
-    return any(app.category == AudioAppCategory.MEETING for app in apps)
+    if _cache is not None and time.monotonic() - _cache[0] < _CACHE_TTL:
+        return any(app.category == AudioAppCategory.MEETING for app in _cache[1])
+
+    # No recent scan to reuse, so stop at the first meeting app found
+    try:
+        for proc in psutil.process_iter(["name"]):
+            info = proc.info
+            if info is not None and info.get("name") in _MEETING_PROCESSES:
+                return True
+    except Exception:
+        pass
+
+    return False
 
 
 def get_active_audio_app() -> Optional[AudioApp]:
@@ -136,15 +177,15 @@ def get_active_audio_app() -> Optional[AudioApp]:
     if not apps:
         return None
 
-    # Meeting apps take priority
+    # Meeting apps take priority, then the first media or browser app, then any app
+    first_media: Optional[AudioApp] = None
     for app in apps:
         if app.category == AudioAppCategory.MEETING:
             return app
+        if first_media is None and app.category in (
+            AudioAppCategory.MEDIA,
+            AudioAppCategory.BROWSER,
+        ):
+            first_media = app
 
-    # Return first media or browser app
-    for app in apps:
-        if app.category in (AudioAppCategory.MEDIA, AudioAppCategory.BROWSER):
-            return app
-
-    # Return any app
-    return apps[0] if apps else None
+    return first_media or apps[0]
@@ -0,0 +1,41 @@
+"""Cached audio device enumeration for Recall.
+
+Enumerating Core Audio devices through PortAudio is slow, and the recorder,
+the system audio monitor and the BlackHole check all need the device list.
+This module shares one enumeration between them for a few seconds.
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import sounddevice as sd
+
+# Seconds a device enumeration is reused before querying PortAudio again
+DEVICE_CACHE_TTL = 5.0
+
+# (monotonic time of the query, device info dicts), or None before the first query
+_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+
+
+def query_devices() -> List[Dict[str, Any]]:
+    """Get info for all audio devices, reusing a recent enumeration.
+
+    Returns:
+        List of sounddevice device info dicts, in device index order.
+
+    Raises:
+        Exception: Any error raised by sounddevice while enumerating devices.
+    """
+    global _cache
+
+    now = time.monotonic()
+    if _cache is None or now - _cache[0] >= DEVICE_CACHE_TTL:
+        _cache = (now, list(sd.query_devices()))
+
+    return list(_cache[1])
+
+
+def clear_device_cache() -> None:
+    """Forget the cached device list, e.g. after a device was plugged in."""
+    global _cache
+    _cache = None
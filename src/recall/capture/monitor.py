@@ -5,6 +5,8 @@ is playing (e.g., from Zoom, YouTube, etc.) via the BlackHole virtual
 audio device.
 """
 
+import math
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Callable, Optional
@@ -12,6 +14,16 @@ from typing import Callable, Optional
 import numpy as np
 import sounddevice as sd
 
+from recall.capture import devices
+
+# Frames per monitor callback: a power of two covering at least 30 ms of audio,
+# so each RMS check works on an evenly sized block without excess callbacks
+MONITOR_BLOCK_FRAMES = 2048
+
+# Sample rate for presence detection; speech and music are easily detected at
+# 16 kHz (the rate the rest of the pipeline uses), with far less data than 44.1 kHz
+MONITOR_SAMPLE_RATE = 16000
+
 
 @dataclass
 class AudioEvent:
@@ -61,7 +73,7 @@ class AudioMonitor:
         self._is_monitoring = False
         self._callback: Optional[Callable[[AudioEvent], None]] = None
         self._was_audio_present = False
-        self._silence_start: Optional[datetime] = None
+        self._silence_start: Optional[float] = None  # time.monotonic() value
         self._current_amplitude: float = 0.0
         self._stream: Optional[sd.InputStream] = None
 
@@ -95,14 +107,52 @@ class AudioMonitor:
         self._was_audio_present = False
         self._silence_start = None
 
-        # Create and start the audio stream
-        self._stream = sd.InputStream(
+        # Create and start the audio stream. One channel is enough to tell whether
+        # anything is playing and halves the data per callback; fall back to
+        # stereo if the device refuses a mono stream.
+        samplerate = self._select_sample_rate(device_id)
+        try:
+            self._stream = self._open_stream(device_id, 1, samplerate)
+        except sd.PortAudioError:
+            self._stream = self._open_stream(device_id, 2, samplerate)
+        self._stream.start()
+
+    def _select_sample_rate(self, device_id: int) -> Optional[int]:
+        """Choose the sample rate to monitor the device at.
+
+        Args:
+            device_id: Index of the device to monitor.
+
+        Returns:
+            MONITOR_SAMPLE_RATE if the device accepts it, otherwise None to
+            use the device's default rate.
+        """
+        try:
+            sd.check_input_settings(device=device_id, samplerate=MONITOR_SAMPLE_RATE)
+            return MONITOR_SAMPLE_RATE
+        except Exception:
+            return None
+
+    def _open_stream(
+        self, device_id: int, channels: int, samplerate: Optional[int]
+    ) -> sd.InputStream:
+        """Open the monitoring input stream.
+
+        Args:
+            device_id: Index of the device to monitor.
+            channels: Number of input channels to capture.
+            samplerate: Sample rate in Hz, or None for the device default.
+
+        Returns:
+            The (not yet started) input stream.
+        """
+        return sd.InputStream(
             device=device_id,
-            channels=2,
-            samplerate=44100,
+            channels=channels,
+            samplerate=samplerate,
+            blocksize=MONITOR_BLOCK_FRAMES,
             callback=self._audio_callback,
         )
-        self._stream.start()
 
     def stop_monitoring(self) -> None:
         """Stop monitoring system audio."""
@@ -122,8 +172,7 @@ class AudioMonitor:
             Device index if found, None otherwise.
         """
         try:
-            devices = sd.query_devices()
-            for device in devices:
+            for device in devices.query_devices():
                 if isinstance(device, dict) and device.get("name") == self.device_name:
                     if device.get("max_input_channels", 0) > 0:
                         return device.get("index")
@@ -161,11 +210,18 @@ class AudioMonitor:
         Returns:
             True if audio is above threshold, False otherwise.
         """
-        # Calculate RMS amplitude
-        rms = np.sqrt(np.mean(audio_data.astype(np.float64) ** 2))
-        self._current_amplitude = float(rms)
+        n = audio_data.size
+        if n == 0:
+            self._current_amplitude = 0.0
+            return False
 
-        return rms > self.silence_threshold
+        # Sum of squares via a BLAS dot product in the native dtype, with no temporaries
+        flat = audio_data.reshape(-1)
+        sum_sq = float(np.dot(flat, flat))
+        self._current_amplitude = math.sqrt(sum_sq / n)
+
+        # Compare squares so the threshold test doesn't depend on the sqrt
+        return sum_sq > self.silence_threshold * self.silence_threshold * n
 
     def _process_audio_state(self, is_audio: bool) -> None:
         """Process the current audio state and emit events.
@@ -173,25 +229,23 @@ class AudioMonitor:
         Args:
             is_audio: Whether audio is currently present
         """
-        now = datetime.now()
-
         if is_audio and not self._was_audio_present:
             # Transition: silence -> audio
             self._was_audio_present = True
             self._silence_start = None
-            self._emit_event(AudioEvent(event_type="started", timestamp=now))
+            self._emit_event(AudioEvent(event_type="started", timestamp=datetime.now()))
 
         elif not is_audio and self._was_audio_present:
             # Audio stopped, start tracking silence duration
+            # (monotonic floats, so no datetime objects are built per callback)
+            now = time.monotonic()
             if self._silence_start is None:
                 self._silence_start = now
-            else:
-                silence_elapsed = (now - self._silence_start).total_seconds()
-                if silence_elapsed >= self.silence_duration:
-                    # Enough silence has passed, emit stopped event
-                    self._was_audio_present = False
-                    self._emit_event(AudioEvent(event_type="stopped", timestamp=now))
-                    self._silence_start = None
+            elif now - self._silence_start >= self.silence_duration:
+                # Enough silence has passed, emit stopped event
+                self._was_audio_present = False
+                self._emit_event(AudioEvent(event_type="stopped", timestamp=datetime.now()))
+                self._silence_start = None
 
         elif is_audio and self._was_audio_present:
             # Still audio, reset silence tracking
@@ -214,8 +268,7 @@ def is_blackhole_available() -> bool:
         True if BlackHole is installed and available, False otherwise.
     """
     try:
-        devices = sd.query_devices()
-        for device in devices:
+        for device in devices.query_devices():
             if isinstance(device, dict):
                 name = device.get("name", "")
                 if "blackhole" in name.lower():
@@ -4,14 +4,35 @@ Provides the Recorder class for capturing audio from microphone input devices.
 Records in 16kHz mono WAV format optimized for Whisper transcription.
 """
 
+import logging
+import threading
+import time
 import wave
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import sounddevice as sd
 
+from recall.capture import devices
+
+logger = logging.getLogger(__name__)
+
+# Frames converted per pass when writing a complete recording, bounding scratch memory
+WAV_WRITE_BLOCK_FRAMES = 65536
+
+# Frames pulled from the input stream per read while recording (64 ms at 16 kHz);
+# a power of two covering at least 30 ms of audio, also used as the stream blocksize
+STREAM_BLOCK_FRAMES = 1024
+
+# Seconds the reader thread sleeps when no audio is waiting in the stream
+READ_POLL_INTERVAL = 0.01
+
+# Seconds stop_recording waits for the reader thread to write its last block
+READER_JOIN_TIMEOUT = 2.0
+
 
 class RecordingError(Exception):
     """Error raised when recording operations fail."""
@@ -85,8 +106,13 @@ class Recorder:
 
         # Recording state
         self._is_recording = False
-        self._recording_data: list = []
+        self._wav: Optional[wave.Wave_write] = None
+        self._wav_path: Optional[Path] = None
+        self._scratch_f32: Optional[np.ndarray] = None
+        self._scratch_i16: Optional[np.ndarray] = None
         self._stream: Optional[sd.InputStream] = None
+        self._reader_thread: Optional[threading.Thread] = None
+        self._reader_error: Optional[BaseException] = None
         self._start_time: Optional[datetime] = None
 
     @property
@@ -108,6 +134,31 @@ class Recorder:
         filename = f"mic_{timestamp.strftime('%Y%m%d_%H%M%S')}.wav"
         return self.output_dir / filename
 
+    def _to_int16(self, audio_data: np.ndarray) -> np.ndarray:
+        """Convert float32 samples to 16-bit PCM in reusable scratch buffers.
+
+        Samples outside [-1.0, 1.0] are clipped rather than wrapping around.
+
+        Args:
+            audio_data: Float audio of shape (frames, channels).
+
+        Returns:
+            A view of the int16 scratch buffer, valid until the next call.
+        """
+        frames = len(audio_data)
+        if self._scratch_f32 is None or frames > len(self._scratch_f32):
+            self._scratch_f32 = np.empty((frames, self.channels), dtype=np.float32)
+            self._scratch_i16 = np.empty((frames, self.channels), dtype=np.int16)
+
+        scaled = self._scratch_f32[:frames]
+        np.multiply(audio_data, 32767.0, out=scaled)
+        np.clip(scaled, -32767.0, 32767.0, out=scaled)
+        np.rint(scaled, out=scaled)
+
+        pcm = self._scratch_i16[:frames]
+        np.copyto(pcm, scaled, casting="unsafe")
+        return pcm
+
     def _write_wav(self, audio_data, filepath: Path) -> None:
         """Write audio data to WAV file.
 
@@ -115,30 +166,40 @@ class Recorder:
             audio_data: Numpy array of audio samples.
             filepath: Path to write the WAV file.
         """
-        import numpy as np
+        with self._open_wav(filepath) as wav:
+            if audio_data.dtype != np.float32:
+                wav.writeframes(audio_data.astype(np.int16).tobytes())
+                return
+
+            # Convert in blocks so no full-length int16 copy is made
+            audio_data = audio_data.reshape(len(audio_data), -1)
+            for start in range(0, len(audio_data), WAV_WRITE_BLOCK_FRAMES):
+                block = audio_data[start : start + WAV_WRITE_BLOCK_FRAMES]
+                wav.writeframesraw(self._to_int16(block))
 
-        # Convert float32 to int16
-        if audio_data.dtype == np.float32:
-            # Scale to int16 range
-            audio_int16 = (audio_data * 32767).astype(np.int16)
-        else:
-            audio_int16 = audio_data.astype(np.int16)
+    def _open_wav(self, filepath: Path) -> wave.Wave_write:
+        """Open a WAV file for writing in the recorder's format.
 
-        # Flatten if needed (remove channel dimension for mono)
-        if audio_int16.ndim > 1 and audio_int16.shape[1] == 1:
-            audio_int16 = audio_int16.flatten()
+        Args:
+            filepath: Path of the WAV file to create.
 
-        with wave.open(str(filepath), "w") as wav:
-            wav.setnchannels(self.channels)
-            wav.setsampwidth(2)  # 16-bit
-            wav.setframerate(self.sample_rate)
-            wav.writeframes(audio_int16.tobytes())
+        Returns:
+            The open WAV writer.
+        """
+        wav = wave.open(str(filepath), "wb")
+        wav.setnchannels(self.channels)
+        wav.setsampwidth(2)  # 16-bit
+        wav.setframerate(self.sample_rate)
+        return wav
 
     def start_recording(self) -> None:
         """Start recording audio.
 
-        Begins recording from the selected input device.
-        Use stop_recording() to end recording and save the file.
+        Begins recording from the selected input device. A reader thread pulls
+        audio from a blocking input stream and writes it to the WAV file as it
+        arrives, so no Python code runs on PortAudio's audio thread and memory
+        use doesn't grow with duration. Use stop_recording() to end recording
+        and finalize the file.
 
         Raises:
             RecordingError: If already recording.
@@ -146,50 +207,116 @@ class Recorder:
         if self._is_recording:
             raise RecordingError("Already recording")
 
-        self._recording_data = []
         self._start_time = datetime.now()
+        self._wav_path = self._generate_filename(self._start_time)
+        self._wav = self._open_wav(self._wav_path)
+        self._reader_error = None
 
-        def callback(indata, frames, time, status):
-            """Callback for audio stream."""
-            self._recording_data.append(indata.copy())
+        try:
+            self._stream = sd.InputStream(
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                device=self.device_id,
+                blocksize=STREAM_BLOCK_FRAMES,
+                dtype="float32",
+            )
+            self._stream.start()
+        except Exception:
+            self._wav.close()
+            self._wav = None
+            self._wav_path.unlink(missing_ok=True)
+            self._stream = None
+            raise
 
-        self._stream = sd.InputStream(
-            samplerate=self.sample_rate,
-            channels=self.channels,
-            device=self.device_id,
-            callback=callback,
-        )
-        self._stream.start()
         self._is_recording = True
+        self._reader_thread = threading.Thread(
+            target=self._read_stream, name="recall-recorder", daemon=True
+        )
+        self._reader_thread.start()
+
+    def _read_stream(self) -> None:
+        """Copy audio from the input stream to the WAV file until recording stops.
+
+        Only frames already waiting in the stream are read, so a read never
+        blocks and the thread sees the stop request within one poll interval.
+        """
+        stream = self._stream
+        wav = self._wav
+        try:
+            while self._is_recording:
+                available = stream.read_available
+                if available <= 0:
+                    time.sleep(READ_POLL_INTERVAL)
+                    continue
+                data, _overflowed = stream.read(available)
+                self._write_block(wav, data)
+
+            # Keep what was captured before the stop request; the stream is
+            # still running, so these frames can still be read
+            remaining = stream.read_available
+            while remaining > 0:
+                data, _overflowed = stream.read(remaining)
+                if not len(data):
+                    break
+                self._write_block(wav, data)
+                remaining -= len(data)
+        except Exception as e:
+            self._reader_error = e
+
+    def _write_block(self, wav: wave.Wave_write, data: np.ndarray) -> None:
+        """Append a block of float32 audio to a WAV file.
+
+        Args:
+            wav: The open WAV writer.
+            data: Audio of shape (frames, channels); empty blocks are skipped.
+        """
+        if len(data):
+            wav.writeframesraw(self._to_int16(data))
 
     def stop_recording(self) -> Path:
-        """Stop recording and save to WAV file.
+        """Stop recording and finalize the WAV file.
 
         Returns:
             Path to the saved WAV file.
 
         Raises:
-            RecordingError: If not currently recording.
+            RecordingError: If not currently recording, if reading from the
+                input stream failed while recording, or if the reader thread
+                did not finish within READER_JOIN_TIMEOUT.
         """
         if not self._is_recording:
             raise RecordingError("Not recording")
 
-        # Stop the stream
+        # The reader drains the running stream before exiting, and it writes
+        # to the WAV file, so it must be gone before either is closed
+        self._is_recording = False
+        reader = self._reader_thread
+        reader.join(timeout=READER_JOIN_TIMEOUT)
+        self._reader_thread = None
+
+        if reader.is_alive():
+            # Leave the stream and file to the stuck reader, which holds its
+            # own references, so a new recording can start cleanly
+            logger.warning(
+                f"Recorder reader thread still running after {READER_JOIN_TIMEOUT}s, "
+                f"abandoning {self._wav_path}"
+            )
+            self._stream = None
+            self._wav = None
+            raise RecordingError("Recording failed: reader thread did not stop")
+
         self._stream.stop()
         self._stream.close()
         self._stream = None
-        self._is_recording = False
 
-        # Concatenate recorded chunks
-        import numpy as np
+        # Closing the writer fills in the WAV header's frame count
+        self._wav.close()
+        self._wav = None
 
-        audio_data = np.concatenate(self._recording_data, axis=0)
+        if self._reader_error is not None:
+            raise RecordingError(f"Recording failed: {self._reader_error}") from self._reader_error
 
-        # Generate filename and save
-        filepath = self._generate_filename(self._start_time)
-        self._write_wav(audio_data, filepath)
-
-        return filepath
+        return self._wav_path
 
     def record(self, duration_seconds: float) -> Path:
         """Record audio for a fixed duration.
@@ -225,10 +352,9 @@ class Recorder:
         Returns:
             List of AudioDevice objects for input devices.
         """
-        devices = sd.query_devices()
         input_devices = []
 
-        for idx, device in enumerate(devices):
+        for idx, device in enumerate(devices.query_devices()):
             if device["max_input_channels"] > 0:
                 input_devices.append(
                     AudioDevice(
@@ -191,7 +191,7 @@ class KnowledgeIngestor:
     def _save_state(self) -> None:
         """Save ingestion state to file."""
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        self.state_file.write_text(json.dumps(self._state, indent=2))
+        self.state_file.write_text(json.dumps(self._state, separators=(",", ":")))
 
     def is_ingested(self, recording_id: str) -> bool:
         """Check if a recording has been ingested.
@@ -140,7 +140,7 @@ class KnowledgeSync:
     def _save_state(self) -> None:
         """Save state to file."""
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        self.state_file.write_text(json.dumps(self._state, indent=2))
+        self.state_file.write_text(json.dumps(self._state, separators=(",", ":")))
 
     def get_pending_changes(self, base_dir: Path) -> ChangeSet:
         """Detect pending changes in the recordings directory.
@@ -10,10 +10,11 @@ This file provides reusable fixtures for testing:
 """
 
 import struct
+import time
 import wave
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, PropertyMock
 
 import pytest
 
@@ -174,9 +175,12 @@ def mock_sounddevice(mocker):
     """Mock sounddevice module for audio capture tests.
 
     Mocks both recording and device query functions.
-    Patches 'recall.capture.recorder.sd' where sounddevice is used.
+    Patches 'recall.capture.recorder.sd' where sounddevice is used, and the
+    shared device list in 'recall.capture.devices'.
     """
     mock = mocker.patch("recall.capture.recorder.sd")
+    mocker.patch("recall.capture.devices.sd", mock)
+    mocker.patch("recall.capture.devices._cache", None)
 
     # Mock device query - return list of devices
     mock.query_devices.return_value = [
@@ -203,23 +207,23 @@ def mock_sounddevice(mocker):
     mock.wait.return_value = None
 
     # Mock InputStream for start/stop workflow
-    # The InputStream captures callback and simulates recording
+    # Blocking reads return the queued blocks in order; tests can append to
+    # mock.input_blocks before starting a recording to simulate captured audio
     mock_stream = MagicMock()
-    captured_callback = [None]
-
-    def capture_input_stream(**kwargs):
-        captured_callback[0] = kwargs.get("callback")
-        return mock_stream
-
-    mock.InputStream.side_effect = capture_input_stream
-
-    def start_recording_mock():
-        # Simulate callback being called with audio data
-        if captured_callback[0]:
-            test_audio = np.zeros((1024, 1), dtype=np.float32)
-            captured_callback[0](test_audio, 1024, None, None)
-
-    mock_stream.start.side_effect = start_recording_mock
+    mock.InputStream.return_value = mock_stream
+    mock.input_blocks = [np.zeros((1024, 1), dtype=np.float32)]
+
+    def read_block(frames):
+        if mock.input_blocks:
+            return mock.input_blocks.pop(0), False
+        # No new audio yet; a real stream would block until a block arrives
+        time.sleep(0.001)
+        return np.zeros((0, 1), dtype=np.float32), False
+
+    mock_stream.read.side_effect = read_block
+    type(mock_stream).read_available = PropertyMock(
+        side_effect=lambda: sum(len(block) for block in mock.input_blocks)
+    )
     mock_stream.stop.return_value = None
     mock_stream.close.return_value = None
 
@@ -7,10 +7,14 @@ This module tests:
 - First-run experience
 """
 
+import hashlib
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 # ============================================================================
 # Test: AppConfig
 # ============================================================================
@@ -151,6 +155,34 @@ class TestModelManager:
 
         assert len(missing) > 0
 
+    def test_get_missing_models_skips_present_files(self, tmp_path):
+        """Test that models already on disk are not reported missing."""
+        from recall.app.bundle import ModelManager
+
+        manager = ModelManager(models_dir=tmp_path)
+        present, *rest = manager.get_required_models()
+        (tmp_path / present.filename).write_bytes(b"model data")
+
+        missing = manager.get_missing_models()
+
+        assert [m.filename for m in missing] == [m.filename for m in rest]
+
+    def test_get_missing_models_cached_until_dir_changes(self, tmp_path):
+        """Test that the missing-model scan is reused until the directory changes."""
+        from recall.app.bundle import ModelManager
+
+        manager = ModelManager(models_dir=tmp_path)
+        first = manager.get_missing_models()
+
+        with patch.object(manager, "_scan_models_dir") as mock_scan:
+            assert manager.get_missing_models() == first
+            mock_scan.assert_not_called()
+
+        (tmp_path / first[0].filename).write_bytes(b"model data")
+        os.utime(tmp_path, ns=(0, 0))
+
+        assert first[0].filename not in [m.filename for m in manager.get_missing_models()]
+
     def test_download_model_creates_file(self, tmp_path):
         """Test that download_model creates the model file."""
         from recall.app.bundle import ModelInfo, ModelManager
@@ -173,6 +205,36 @@ class TestModelManager:
 
             assert result.exists()
 
+    def test_download_file_verifies_sha256(self, tmp_path):
+        """Test that the streamed download is checked against its SHA256."""
+        from recall.app.bundle import ModelManager
+
+        source = tmp_path / "source.bin"
+        source.write_bytes(b"model weights")
+        expected = hashlib.sha256(b"model weights").hexdigest()
+
+        manager = ModelManager(models_dir=tmp_path / "models")
+        output_path = manager.models_dir / "model.bin"
+
+        result = manager._download_file(source.as_uri(), output_path, 1, sha256=expected)
+
+        assert result.read_bytes() == b"model weights"
+
+    def test_download_file_rejects_sha256_mismatch(self, tmp_path):
+        """Test that a checksum mismatch raises and removes the partial file."""
+        from recall.app.bundle import ModelManager
+
+        source = tmp_path / "source.bin"
+        source.write_bytes(b"corrupted weights")
+
+        manager = ModelManager(models_dir=tmp_path / "models")
+        output_path = manager.models_dir / "model.bin"
+
+        with pytest.raises(ValueError, match="Checksum mismatch"):
+            manager._download_file(source.as_uri(), output_path, 1, sha256="0" * 64)
+
+        assert not output_path.exists()
+
 
 # ============================================================================
 # Test: DownloadProgress
@@ -149,6 +149,34 @@ class TestHotkeyManager:
 
             assert manager.is_listening is False
 
+    def test_manager_with_broken_pynput(self):
+        """Test that a pynput import failure disables hotkeys instead of raising."""
+        from recall.app.hotkeys import HotkeyConfig, HotkeyManager
+
+        with patch("recall.app.hotkeys.PYNPUT_AVAILABLE", True):
+            with patch("recall.app.hotkeys.keyboard", None):
+                # A None entry makes the import raise ImportError
+                with patch.dict("sys.modules", {"pynput": None}):
+                    manager = HotkeyManager(HotkeyConfig())
+
+                    manager.start_listening()
+
+                    assert manager.is_listening is False
+
+    def test_pynput_imported_lazily(self):
+        """Test that pynput is only imported when the listener starts."""
+        from recall.app.hotkeys import HotkeyConfig, HotkeyManager
+
+        with patch("recall.app.hotkeys.PYNPUT_AVAILABLE", True):
+            with patch("recall.app.hotkeys._get_keyboard") as mock_get_keyboard:
+                manager = HotkeyManager(HotkeyConfig())
+
+                mock_get_keyboard.assert_not_called()
+
+                manager.start_listening()
+
+                mock_get_keyboard.assert_called_once()
+
     def test_manager_disabled_config(self):
         """Test that disabled config prevents listening."""
         from recall.app.hotkeys import HotkeyConfig, HotkeyManager
@@ -162,6 +190,169 @@ class TestHotkeyManager:
             assert manager.is_listening is False
 
 
+# ============================================================================
+# Test: Main Run Loop Hotkeys
+# ============================================================================
+
+
+def _fake_quartz():
+    """Build a stand-in for the Quartz module with distinct flag values."""
+    quartz = MagicMock()
+    quartz.kCGEventFlagMaskShift = 1 << 17
+    quartz.kCGEventFlagMaskControl = 1 << 18
+    quartz.kCGEventFlagMaskAlternate = 1 << 19
+    quartz.kCGEventFlagMaskCommand = 1 << 20
+    quartz.kCGEventTapDisabledByTimeout = -2
+    quartz.kCGKeyboardEventAutorepeat = "autorepeat"
+    quartz.kCGKeyboardEventKeycode = "keycode"
+    return quartz
+
+
+class TestMainRunLoopHotKeys:
+    """Tests for the Quartz event tap listener."""
+
+    def test_start_adds_tap_to_main_run_loop(self):
+        """Test that starting installs the tap on the main run loop."""
+        from recall.app.hotkeys import MainRunLoopHotKeys
+
+        quartz = _fake_quartz()
+        with patch.dict("sys.modules", {"Quartz": quartz}):
+            listener = MainRunLoopHotKeys({"<cmd>+<shift>+r": MagicMock()})
+            listener.start()
+
+            quartz.CFRunLoopAddSource.assert_called_once_with(
+                quartz.CFRunLoopGetMain(),
+                quartz.CFMachPortCreateRunLoopSource(),
+                quartz.kCFRunLoopCommonModes,
+            )
+
+            listener.stop()
+
+            quartz.CFMachPortInvalidate.assert_called_once()
+
+    def test_key_event_dispatches_matching_hotkey(self):
+        """Test that only the exact key and modifiers trigger a callback."""
+        from recall.app.hotkeys import MainRunLoopHotKeys
+
+        quartz = _fake_quartz()
+        callback = MagicMock()
+        fields = {"keycode": 15, "autorepeat": 0}
+        quartz.CGEventGetIntegerValueField.side_effect = lambda event, field: fields[field]
+
+        with patch.dict("sys.modules", {"Quartz": quartz}):
+            listener = MainRunLoopHotKeys({"<cmd>+<shift>+r": callback})
+            listener.start()
+
+            quartz.CGEventGetFlags.return_value = quartz.kCGEventFlagMaskCommand
+            listener._handle_event(None, 10, "event", None)
+            callback.assert_not_called()
+
+            quartz.CGEventGetFlags.return_value = (
+                quartz.kCGEventFlagMaskCommand | quartz.kCGEventFlagMaskShift | 0x100
+            )
+            assert listener._handle_event(None, 10, "event", None) == "event"
+            callback.assert_called_once()
+
+            fields["autorepeat"] = 1
+            listener._handle_event(None, 10, "event", None)
+            callback.assert_called_once()
+
+    def test_key_event_matches_current_layout(self):
+        """Test that character keys are matched by what they type, not by position."""
+        from recall.app.hotkeys import MainRunLoopHotKeys
+
+        quartz = _fake_quartz()
+        callback = MagicMock()
+        fields = {"keycode": 15, "autorepeat": 0}
+        quartz.CGEventGetIntegerValueField.side_effect = lambda event, field: fields[field]
+        quartz.CGEventGetFlags.return_value = (
+            quartz.kCGEventFlagMaskCommand | quartz.kCGEventFlagMaskShift
+        )
+        # Dvorak: the ANSI "R" position types "p", and R sits on the ANSI "O" key
+        layout = {15: ("p", "p"), 31: ("r", "r")}
+
+        with patch.dict("sys.modules", {"Quartz": quartz}):
+            with patch("recall.app.hotkeys._key_code_characters", layout.get):
+                listener = MainRunLoopHotKeys({"<cmd>+<shift>+r": callback})
+                listener.start()
+
+                listener._handle_event(None, 10, "event", None)
+                callback.assert_not_called()
+
+                fields["keycode"] = 31
+                listener._handle_event(None, 10, "event", None)
+                callback.assert_called_once()
+
+    def test_key_characters_fall_back_to_us_layout(self):
+        """Test that key codes map to US QWERTY characters when no layout can be read."""
+        from recall.app.hotkeys import _key_code_characters
+
+        with patch("recall.app.hotkeys._carbon_key_layout", return_value=None):
+            assert _key_code_characters(15) == ("r",)
+            assert _key_code_characters(127) == ()
+
+    def test_unknown_key_is_rejected(self):
+        """Test that hotkeys without a known key code fail to start."""
+        import pytest
+
+        from recall.app.hotkeys import MainRunLoopHotKeys
+
+        with patch.dict("sys.modules", {"Quartz": _fake_quartz()}):
+            listener = MainRunLoopHotKeys({"<cmd>+<shift>+pause": MagicMock()})
+
+            with pytest.raises(ValueError):
+                listener.start()
+
+    def test_manager_prefers_main_run_loop(self):
+        """Test that the manager uses the event tap instead of pynput when asked."""
+        from recall.app.hotkeys import HotkeyConfig, HotkeyManager, MainRunLoopHotKeys
+
+        with patch("recall.app.hotkeys.QUARTZ_AVAILABLE", True):
+            with patch("recall.app.hotkeys._get_keyboard") as mock_get_keyboard:
+                with patch.dict("sys.modules", {"Quartz": _fake_quartz()}):
+                    manager = HotkeyManager(HotkeyConfig(), use_main_run_loop=True)
+
+                    manager.start_listening()
+
+                    assert manager.is_listening is True
+                    assert isinstance(manager._listener, MainRunLoopHotKeys)
+                    mock_get_keyboard.assert_not_called()
+
+    def test_manager_falls_back_to_pynput(self):
+        """Test that pynput is used when the event tap cannot be created."""
+        from recall.app.hotkeys import HotkeyConfig, HotkeyManager
+
+        quartz = _fake_quartz()
+        quartz.CGEventTapCreate.return_value = None
+
+        with patch("recall.app.hotkeys.QUARTZ_AVAILABLE", True):
+            with patch("recall.app.hotkeys.PYNPUT_AVAILABLE", True):
+                with patch("recall.app.hotkeys.keyboard") as mock_keyboard:
+                    with patch.dict("sys.modules", {"Quartz": quartz}):
+                        manager = HotkeyManager(HotkeyConfig(), use_main_run_loop=True)
+
+                        manager.start_listening()
+
+                        assert manager._listener is mock_keyboard.GlobalHotKeys.return_value
+
+    def test_manager_falls_back_on_any_tap_error(self):
+        """Test that an unexpected error from the event tap doesn't escape start_listening."""
+        from recall.app.hotkeys import HotkeyConfig, HotkeyManager
+
+        quartz = _fake_quartz()
+        quartz.CGEventTapCreate.side_effect = TypeError("bad callback signature")
+
+        with patch("recall.app.hotkeys.QUARTZ_AVAILABLE", True):
+            with patch("recall.app.hotkeys.PYNPUT_AVAILABLE", True):
+                with patch("recall.app.hotkeys.keyboard") as mock_keyboard:
+                    with patch.dict("sys.modules", {"Quartz": quartz}):
+                        manager = HotkeyManager(HotkeyConfig(), use_main_run_loop=True)
+
+                        manager.start_listening()
+
+                        assert manager._listener is mock_keyboard.GlobalHotKeys.return_value
+
+
 # ============================================================================
 # Test: Hotkey Callbacks
 # ============================================================================
@@ -277,6 +468,15 @@ class TestHotkeyParsing:
         assert result["modifiers"] == []
         assert result["key"] == "f1"
 
+    def test_parse_mixed_case_hotkey(self):
+        """Test that parsing is case-insensitive."""
+        from recall.app.hotkeys import parse_hotkey
+
+        result = parse_hotkey("<CMD>+<Option>+X")
+
+        assert result["modifiers"] == ["cmd", "option"]
+        assert result["key"] == "x"
+
     def test_format_hotkey_for_display(self):
         """Test formatting hotkey for display."""
         from recall.app.hotkeys import format_hotkey_display
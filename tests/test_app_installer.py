@@ -89,6 +89,17 @@ class TestDMGBuilder:
         # Should have applications symlink
         assert "applications" in str(spec).lower() or "symlinks" in spec
 
+    def test_dmg_spec_contents_are_independent(self):
+        """Test that editing one spec's contents doesn't leak into later specs."""
+        from recall.app.installer import DMGBuilder
+
+        builder = DMGBuilder()
+        spec = builder.get_dmg_spec()
+        spec["contents"][0]["x"] = 999
+
+        assert builder.get_dmg_spec()["contents"][0]["x"] == 150
+        assert DMGBuilder.DMG_CONTENTS[0]["x"] == 150
+
 
 # ============================================================================
 # Test: FirstRunWizard
@@ -155,6 +166,20 @@ class TestFirstRunWizard:
         page_names = [p.name for p in pages]
         assert any("complete" in name.lower() or "finish" in name.lower() for name in page_names)
 
+    def test_wizard_pages_are_shared_and_immutable(self):
+        """Test that wizards share the frozen default pages."""
+        import dataclasses
+
+        import pytest
+
+        from recall.app.installer import FirstRunWizard
+
+        pages = FirstRunWizard().get_pages()
+
+        assert pages is FirstRunWizard().get_pages()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            pages[0].title = "Changed"
+
 
 # ============================================================================
 # Test: WizardPage
@@ -196,6 +221,14 @@ class TestWizardPage:
         assert page.action is not None
         assert page.action() is True
 
+    def test_wizard_page_rendered(self):
+        """Test WizardPage pre-renders its console text."""
+        from recall.app.installer import WizardPage
+
+        page = WizardPage(name="test", title="Title", description="Body")
+
+        assert page.rendered == "\nTitle\n-----\nBody\n\n"
+
 
 # ============================================================================
 # Test: AppLauncher
@@ -213,6 +246,18 @@ class TestAppLauncher:
 
         assert launcher is not None
 
+    def test_app_launcher_rejects_file_as_config_dir(self, tmp_path):
+        """Test that a regular file at the config path is reported up front."""
+        import pytest
+
+        from recall.app.installer import AppLauncher
+
+        config_file = tmp_path / "config"
+        config_file.write_text("")
+
+        with pytest.raises(FileExistsError):
+            AppLauncher(config_dir=config_file)
+
     def test_check_first_run(self, tmp_path):
         """Test checking if this is first run."""
         from recall.app.installer import AppLauncher
@@ -231,6 +276,45 @@ class TestAppLauncher:
 
         assert launcher.is_first_run() is False
 
+    def test_mark_first_run_complete_writes_sentinel(self, tmp_path):
+        """Test that the sentinel holds JSON and can be rewritten."""
+        import json
+
+        from recall.app.installer import AppLauncher
+
+        launcher = AppLauncher(config_dir=tmp_path)
+        launcher.mark_first_run_complete()
+        launcher.mark_first_run_complete()
+
+        content = json.loads((tmp_path / AppLauncher.SETUP_COMPLETE_FILE).read_text())
+
+        assert content == {"version": "0.1.0", "setup_complete": True}
+
+    def test_first_run_check_is_cached(self, tmp_path):
+        """Test that the setup file is only checked once."""
+        from recall.app.installer import AppLauncher
+
+        launcher = AppLauncher(config_dir=tmp_path)
+        assert launcher.is_first_run() is True
+
+        (tmp_path / AppLauncher.SETUP_COMPLETE_FILE).write_text("{}")
+
+        assert launcher.is_first_run() is True
+        assert AppLauncher(config_dir=tmp_path).is_first_run() is False
+
+    def test_model_manager_created_lazily(self, tmp_path):
+        """Test that the model manager is only built when first accessed."""
+        from recall.app.installer import AppLauncher
+
+        launcher = AppLauncher(config_dir=tmp_path)
+
+        assert launcher._model_manager is None
+
+        manager = launcher.model_manager
+
+        assert manager is launcher.model_manager
+        assert manager.models_dir == tmp_path / "models"
+
     def test_get_launch_mode(self, tmp_path):
         """Test getting launch mode."""
         from recall.app.installer import AppLauncher, LaunchMode
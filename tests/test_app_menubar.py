@@ -19,6 +19,26 @@ from recall.app.menubar import (
     RecallMenuBar,
 )
 
+
+def _fake_app_helper():
+    """Build a stand-in for PyObjCTools that holds main-thread calls until run.
+
+    Returns:
+        (sys.modules entries to patch in, list of posted (func, args) calls)
+    """
+    posted = []
+    pyobjctools = MagicMock()
+    pyobjctools.AppHelper.callAfter.side_effect = lambda func, *args: posted.append((func, args))
+    return {"PyObjCTools": pyobjctools}, posted
+
+
+def _run_posted(posted):
+    """Run the calls posted to the fake main thread, in order."""
+    while posted:
+        func, args = posted.pop(0)
+        func(*args)
+
+
 # ============================================================================
 # Test: AppState Enum
 # ============================================================================
@@ -58,17 +78,17 @@ class TestMenuItem:
         """Test that MenuItem can be created with required fields."""
         item = MenuItem(
             title="Start Recording",
-            callback="on_start_recording",
+            callback=RecallMenuBar.on_start_recording,
         )
 
         assert item.title == "Start Recording"
-        assert item.callback == "on_start_recording"
+        assert item.callback is RecallMenuBar.on_start_recording
 
     def test_menu_item_has_optional_key(self):
         """Test that MenuItem has optional keyboard shortcut."""
         item = MenuItem(
             title="Start Recording",
-            callback="on_start_recording",
+            callback=RecallMenuBar.on_start_recording,
             key="r",
         )
 
@@ -78,7 +98,7 @@ class TestMenuItem:
         """Test that MenuItem is enabled by default."""
         item = MenuItem(
             title="Start Recording",
-            callback="on_start_recording",
+            callback=RecallMenuBar.on_start_recording,
         )
 
         assert item.enabled is True
@@ -89,6 +109,16 @@ class TestMenuItem:
 
         assert item.is_separator is True
 
+    def test_menu_item_is_immutable(self):
+        """Test that MenuItem instances cannot be modified once shared."""
+        import dataclasses
+
+        item = MenuItem(title="Quit", callback=RecallMenuBar.on_quit)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            item.title = "Exit"
+        assert MenuItem.separator() is MenuItem.separator()
+
 
 # ============================================================================
 # Test: RecallMenuBar Initialization
@@ -276,11 +306,121 @@ class TestRecallMenuBarCallbacks:
         with patch("recall.app.menubar.RUMPS_AVAILABLE", False):
             app = RecallMenuBar()
             app.set_state(AppState.RECORDING)
+            # Hold the ingestion job so the PROCESSING state can be inspected
+            app._ingest_executor = MagicMock()
+
+            app.on_stop_recording(None)
+
+            assert app.state == AppState.PROCESSING
+
+    def test_on_stop_recording_processes_in_background(self):
+        """Test that stopping hands ingestion to a worker and reports back."""
+        from pathlib import Path
+
+        from recall.app.recording import RecordingStatus
+
+        with patch("recall.app.menubar.RUMPS_AVAILABLE", False):
+            app = RecallMenuBar()
+            app.set_state(AppState.RECORDING)
+
+            controller = MagicMock()
+            controller.stop_recording.return_value = RecordingStatus(
+                state=AppState.PROCESSING,
+                duration_seconds=65,
+                audio_path=Path("/tmp/test.wav"),
+            )
+
+            def process(audio_path, on_complete):
+                on_complete(MagicMock(title="Standup"))
+                return RecordingStatus(state=AppState.IDLE)
+
+            controller.process_recording.side_effect = process
+            app.recording_controller = controller
+            app.notification_manager = MagicMock()
+
+            app.on_stop_recording(None)
+            app._ingest_executor.shutdown(wait=True)
+
+            app.notification_manager.notify_recording_saved.assert_called_once_with(
+                title="Standup", duration=65
+            )
+            assert app.state == AppState.IDLE
+
+    def test_on_stop_recording_returns_to_idle_when_worker_fails(self):
+        """Test that an error on the ingestion worker is reported and clears PROCESSING."""
+        with patch("recall.app.menubar.RUMPS_AVAILABLE", False):
+            app = RecallMenuBar()
+            app.set_state(AppState.RECORDING)
+
+            app.recording_controller = MagicMock()
+            app.recording_controller.stop_recording.side_effect = RuntimeError("device lost")
+            app.notification_manager = MagicMock()
+
+            app.on_stop_recording(None)
+            app._ingest_executor.shutdown(wait=True)
+
+            app.notification_manager.notify_error.assert_called_once_with("device lost")
+            assert app.state == AppState.IDLE
+
+    def test_on_stop_recording_returns_to_idle_when_notification_fails(self):
+        """Test that a failing notification backend does not leave the app in PROCESSING."""
+        from recall.app.recording import RecordingStatus
+
+        with patch("recall.app.menubar.RUMPS_AVAILABLE", False):
+            app = RecallMenuBar()
+            app.set_state(AppState.RECORDING)
+
+            app.recording_controller = MagicMock()
+            app.recording_controller.stop_recording.return_value = RecordingStatus(
+                state=AppState.PROCESSING, error="No audio captured"
+            )
+            app.notification_manager = MagicMock()
+            app.notification_manager.notify_error.side_effect = RuntimeError("no backend")
 
             app.on_stop_recording(None)
+            app._ingest_executor.shutdown(wait=True)
+
+            assert app.notification_manager.notify_error.call_count == 2
+            assert app.state == AppState.IDLE
 
+    def test_duplicate_recording_actions_are_ignored(self):
+        """Test that repeated start/stop actions only act once."""
+        with patch("recall.app.menubar.RUMPS_AVAILABLE", False):
+            app = RecallMenuBar()
+            app.recording_controller = MagicMock()
+            app.recording_controller.start_recording.return_value.state = AppState.RECORDING
+            app._ingest_executor = MagicMock()
+
+            app.on_start_recording(None)
+            app.on_start_recording(None)
+            app.on_stop_recording(None)
+            app.on_stop_recording(None)
+            app._toggle_recording()
+
+            app.recording_controller.start_recording.assert_called_once()
+            app._ingest_executor.submit.assert_called_once()
             assert app.state == AppState.PROCESSING
 
+    def test_on_open_library_opens_recordings_folder(self, tmp_path):
+        """Test that Open Library hands the recordings folder to NSWorkspace."""
+        appkit = MagicMock()
+        foundation = MagicMock()
+        library = tmp_path / "recordings"
+
+        with patch("recall.app.menubar.RUMPS_AVAILABLE", True):
+            with patch("recall.app.menubar.rumps", MagicMock(), create=True):
+                with patch.dict("sys.modules", {"AppKit": appkit, "Foundation": foundation}):
+                    app = RecallMenuBar(output_dir=library)
+
+                    app.on_open_library(None)
+
+        assert library.is_dir()
+        assert "recording_controller" not in app.__dict__
+        foundation.NSURL.fileURLWithPath_.assert_called_once_with(str(library))
+        appkit.NSWorkspace.sharedWorkspace().openURL_.assert_called_once_with(
+            foundation.NSURL.fileURLWithPath_.return_value
+        )
+
     def test_on_quit_sets_quit_flag(self):
         """Test that on_quit sets the quit flag."""
         with patch("recall.app.menubar.RUMPS_AVAILABLE", False):
@@ -290,6 +430,32 @@ class TestRecallMenuBarCallbacks:
 
             assert app._quit_requested is True
 
+    def test_on_quit_waits_for_ingestion_without_blocking(self):
+        """Test that on_quit returns at once and quits after ingestion finishes."""
+        import threading
+
+        mock_rumps = MagicMock()
+        release = threading.Event()
+        modules, posted = _fake_app_helper()
+
+        with patch("recall.app.menubar.RUMPS_AVAILABLE", True):
+            with patch("recall.app.menubar.rumps", mock_rumps, create=True):
+                with patch.dict("sys.modules", modules):
+                    app = RecallMenuBar()
+                    app._ingest_executor.submit(release.wait, 5)
+
+                    app.on_quit(None)
+                    app.on_quit(None)
+
+                    assert app._quit_requested is True
+                    mock_rumps.quit_application.assert_not_called()
+
+                    release.set()
+                    app._ingest_executor.shutdown(wait=True)
+                    _run_posted(posted)
+
+                    mock_rumps.quit_application.assert_called_once()
+
 
 # ============================================================================
 # Test: Properties
@@ -336,3 +502,210 @@ class TestRecallMenuBarProperties:
                 # Should have duration (via controller)
                 assert app.recording_duration is not None
                 assert app.recording_duration >= 0
+
+
+# ============================================================================
+# Test: rumps Menu Updates
+# ============================================================================
+
+
+class TestRecallMenuBarRumpsMenu:
+    """Tests for how the rumps menu is kept in sync with the state."""
+
+    def test_menu_items_are_reused(self):
+        """Test that unchanged menu items are shared between states."""
+        with patch("recall.app.menubar.RUMPS_AVAILABLE", False):
+            app = RecallMenuBar()
+            idle_items = app.get_menu_items()
+
+            app.set_state(AppState.RECORDING)
+            recording_items = app.get_menu_items()
+
+            assert idle_items[0] is not recording_items[0]
+            assert all(a is b for a, b in zip(idle_items[1:], recording_items[1:], strict=True))
+
+            app.set_state(AppState.IDLE)
+
+            assert app.get_menu_items() is idle_items
+
+    def test_state_change_patches_menu_in_place(self):
+        """Test that a state change updates the toggle without rebuilding."""
+        mock_rumps = MagicMock()
+        mock_rumps.MenuItem.side_effect = lambda **kwargs: MagicMock(**kwargs)
+
+        with patch("recall.app.menubar.RUMPS_AVAILABLE", True):
+            with patch("recall.app.menubar.rumps", mock_rumps, create=True):
+                app = RecallMenuBar()
+                menu = app._rumps_app.menu
+                toggle = app._recording_menu_item
+                created = mock_rumps.MenuItem.call_count
+
+                app.set_state(AppState.RECORDING)
+
+                menu.clear.assert_called_once()
+                menu.update.assert_called_once()
+                menu.add.assert_not_called()
+                assert mock_rumps.MenuItem.call_count == created
+                assert toggle.title == "Stop Recording"
+                toggle.set_callback.assert_called_once_with(app.on_stop_recording, key="r")
+
+    def test_duration_timer_runs_only_while_recording(self):
+        """Test that the elapsed time is shown in the title only while recording."""
+        mock_rumps = MagicMock()
+        mock_rumps.MenuItem.side_effect = lambda **kwargs: MagicMock(**kwargs)
+        mock_rumps.Timer.return_value.is_alive.return_value = False
+
+        with patch("recall.app.menubar.RUMPS_AVAILABLE", True):
+            with patch("recall.app.menubar.rumps", mock_rumps, create=True):
+                app = RecallMenuBar()
+                timer = app._duration_timer
+
+                app.set_state(AppState.RECORDING)
+
+                timer.start.assert_called_once()
+                assert app._rumps_app.title == f"{AppState.RECORDING.icon} 00:00"
+
+                timer.is_alive.return_value = True
+                app.set_state(AppState.PROCESSING)
+
+                timer.stop.assert_called_once()
+                assert app._rumps_app.title == AppState.PROCESSING.icon
+
+    def test_same_state_skips_ui_update(self):
+        """Test that setting the current state again does not touch the UI."""
+        mock_rumps = MagicMock()
+        mock_rumps.MenuItem.side_effect = lambda **kwargs: MagicMock(**kwargs)
+
+        with patch("recall.app.menubar.RUMPS_AVAILABLE", True):
+            with patch("recall.app.menubar.rumps", mock_rumps, create=True):
+                app = RecallMenuBar()
+
+                with patch.object(app, "_refresh_rumps_ui") as mock_refresh:
+                    app.set_state(AppState.IDLE)
+
+                    mock_refresh.assert_not_called()
+
+    def test_disabled_item_built_without_callback(self):
+        """Test that a disabled item gets no callback when the menu is built."""
+        mock_rumps = MagicMock()
+        mock_rumps.MenuItem.side_effect = lambda **kwargs: MagicMock(**kwargs)
+
+        with patch("recall.app.menubar.RUMPS_AVAILABLE", True):
+            with patch("recall.app.menubar.rumps", mock_rumps, create=True):
+                app = RecallMenuBar()
+                app._state = AppState.PROCESSING
+
+                app._setup_rumps_menu()
+
+                toggle = app._recording_menu_item
+                assert toggle.title == "Processing..."
+                assert toggle.callback is None
+                toggle.set_callback.assert_not_called()
+
+
+# ============================================================================
+# Test: Lazy Subsystems
+# ============================================================================
+
+
+class TestRecallMenuBarLazySubsystems:
+    """Tests for deferred creation of the menu bar subsystems."""
+
+    def test_subsystems_created_on_first_access(self):
+        """Test that subsystems are not built until they are used."""
+        with patch("recall.app.menubar.RUMPS_AVAILABLE", False):
+            app = RecallMenuBar()
+
+            for name in ("recording_controller", "notification_manager", "hotkey_manager"):
+                assert name not in app.__dict__
+
+            assert app.hotkey_manager is app.hotkey_manager
+            assert app.hotkey_manager.on_toggle_recording is not None
+
+    def test_recording_controller_preloaded_in_background(self):
+        """Test that a preloaded recording controller is reused."""
+        with patch("recall.app.menubar.RUMPS_AVAILABLE", False):
+            app = RecallMenuBar()
+
+            app._preload_subsystems()
+            future = app._recording_controller_future
+
+            assert app.recording_controller is future.result()
+            assert app.recording_controller is app.recording_controller
+
+    def test_hotkey_callbacks_do_not_keep_app_alive(self):
+        """Test that the hotkey callbacks hold only a weak reference to the app."""
+        import weakref
+
+        with patch("recall.app.menubar.RUMPS_AVAILABLE", False):
+            app = RecallMenuBar()
+            manager = app.hotkey_manager
+            app_ref = weakref.ref(app)
+
+            del app
+
+            assert app_ref() is None
+            manager._handle_quick_note()
+
+
+# ============================================================================
+# Test: Main Thread UI Updates
+# ============================================================================
+
+
+class TestRecallMenuBarMainThread:
+    """Tests for marshalling UI updates onto the main thread."""
+
+    def test_state_change_off_main_thread_is_posted(self):
+        """Test that UI updates from other threads are posted to the main thread."""
+        import threading
+
+        mock_rumps = MagicMock()
+        mock_rumps.MenuItem.side_effect = lambda **kwargs: MagicMock(**kwargs)
+        modules, posted = _fake_app_helper()
+
+        with patch("recall.app.menubar.RUMPS_AVAILABLE", True):
+            with patch("recall.app.menubar.rumps", mock_rumps, create=True):
+                with patch.dict("sys.modules", modules):
+                    app = RecallMenuBar()
+                    toggle = app._recording_menu_item
+
+                    thread = threading.Thread(target=app.set_state, args=(AppState.RECORDING,))
+                    thread.start()
+                    thread.join()
+
+                    assert app.state == AppState.RECORDING
+                    assert toggle.title == "Start Recording"
+
+                    _run_posted(posted)
+
+                    assert toggle.title == "Stop Recording"
+                    assert app._rumps_app.title.startswith(AppState.RECORDING.icon)
+
+    def test_queued_state_changes_are_coalesced(self):
+        """Test that rapid transitions off the main thread refresh the UI once."""
+        import threading
+
+        mock_rumps = MagicMock()
+        mock_rumps.MenuItem.side_effect = lambda **kwargs: MagicMock(**kwargs)
+        modules, posted = _fake_app_helper()
+
+        def toggle_repeatedly(app):
+            for state in (AppState.RECORDING, AppState.IDLE, AppState.RECORDING):
+                app.set_state(state)
+
+        with patch("recall.app.menubar.RUMPS_AVAILABLE", True):
+            with patch("recall.app.menubar.rumps", mock_rumps, create=True):
+                with patch.dict("sys.modules", modules):
+                    app = RecallMenuBar()
+
+                    thread = threading.Thread(target=toggle_repeatedly, args=(app,))
+                    thread.start()
+                    thread.join()
+
+                    assert len(posted) == 1
+
+                    _run_posted(posted)
+
+                    assert app._recording_menu_item.title == "Stop Recording"
+                    app._recording_menu_item.set_callback.assert_called_once()
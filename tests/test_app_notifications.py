@@ -64,6 +64,87 @@ class TestNotificationManager:
         finally:
             notifications_module.rumps = original_rumps
 
+    def test_send_notification_logs_without_rumps(self, caplog):
+        """Test that notifications are logged when rumps is unavailable."""
+        import logging
+
+        from recall.app.notifications import NotificationManager
+
+        with patch("recall.app.notifications.rumps", None):
+            with caplog.at_level(logging.INFO, logger="recall.app.notifications"):
+                NotificationManager().send("Title", "Message")
+
+        assert caplog.records[-1].getMessage() == "Notification: Title - Message"
+
+    def test_send_notification_coalesces_duplicates(self):
+        """Test that only identical notifications are merged when coalescing."""
+        from recall.app.notifications import NotificationManager
+
+        mock_rumps = MagicMock()
+
+        with (
+            patch("recall.app.notifications.rumps", mock_rumps),
+            patch("recall.app.notifications.threading.Timer") as mock_timer,
+        ):
+            manager = NotificationManager(coalesce_window=0.25)
+            manager.send("Auto-Recording Started", "Zoom", sound=False)
+            manager.send("Auto-Recording Started", "Zoom")
+            manager.send("Recording Saved", "standup.wav", sound=False)
+            manager.send("Recording Saved", "retro.wav", sound=False)
+
+            mock_timer.assert_called_once_with(0.25, manager._run_on_main, args=(manager.flush,))
+            mock_rumps.notification.assert_not_called()
+
+            manager.flush()
+
+        assert mock_rumps.notification.call_args_list == [
+            call(title="Auto-Recording Started", subtitle="", message="Zoom", sound=True),
+            call(title="Recording Saved", subtitle="", message="standup.wav", sound=False),
+            call(title="Recording Saved", subtitle="", message="retro.wav", sound=False),
+        ]
+
+    def test_notifications_posted_on_main_thread(self):
+        """Test that delivery goes through the supplied main-thread runner."""
+        from recall.app.notifications import NotificationManager
+
+        mock_rumps = MagicMock()
+        posted = []
+
+        with patch("recall.app.notifications.rumps", mock_rumps):
+            manager = NotificationManager(
+                run_on_main=lambda func, *args: posted.append((func, args))
+            )
+            manager.send("Title", "Message")
+
+            mock_rumps.notification.assert_not_called()
+
+            func, args = posted.pop()
+            func(*args)
+
+        mock_rumps.notification.assert_called_once_with(
+            title="Title", subtitle="", message="Message", sound=True
+        )
+
+    def test_coalesced_notifications_delivered_by_timer(self):
+        """Test that the coalescing timer delivers held notifications."""
+        import time
+
+        from recall.app.notifications import NotificationManager
+
+        mock_rumps = MagicMock()
+
+        with patch("recall.app.notifications.rumps", mock_rumps):
+            manager = NotificationManager(coalesce_window=0.01)
+            manager.send("Title", "Message")
+
+            deadline = time.monotonic() + 2.0
+            while not mock_rumps.notification.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        mock_rumps.notification.assert_called_once_with(
+            title="Title", subtitle="", message="Message", sound=True
+        )
+
     def test_send_notification_with_subtitle(self):
         """Test sending a notification with subtitle."""
         import recall.app.notifications as notifications_module
@@ -266,6 +347,37 @@ class TestAutoRecordingConfig:
         assert config.is_app_whitelisted("zoom.us") is True
         assert config.is_app_whitelisted("Safari") is False
 
+    def test_config_whitelist_is_case_insensitive(self):
+        """Test that whitelist matching ignores case."""
+        from recall.app.notifications import AutoRecordingConfig
+
+        config = AutoRecordingConfig(app_whitelist={"zoom.us"})
+        config.add_to_whitelist("Around")
+
+        assert config.is_app_whitelisted("Zoom.us") is True
+        assert config.is_app_whitelisted("AROUND") is True
+
+        config.remove_from_whitelist("ZOOM.US")
+
+        assert config.is_app_whitelisted("zoom.us") is False
+        assert config.app_whitelist == {"Around"}
+
+    def test_config_whitelist_mutated_directly(self):
+        """Test that lookups follow direct changes to app_whitelist."""
+        from recall.app.notifications import AutoRecordingConfig
+
+        config = AutoRecordingConfig(app_whitelist={"zoom.us"})
+
+        config.app_whitelist.add("Zoom2")
+        assert config.is_app_whitelisted("zoom2") is True
+
+        config.app_whitelist -= {"Zoom2"}
+        assert config.is_app_whitelisted("zoom2") is False
+
+        config.app_whitelist = {"Around"}
+        assert config.is_app_whitelisted("zoom.us") is False
+        assert config.is_app_whitelisted("around") is True
+
     def test_config_from_dict(self):
         """Test creating config from dictionary."""
         from recall.app.notifications import AutoRecordingConfig
@@ -282,6 +394,33 @@ class TestAutoRecordingConfig:
         assert config.detect_meeting_apps is False
         assert "CustomApp" in config.app_whitelist
 
+    def test_whitelist_keeps_other_spellings(self):
+        """Test that removing one spelling keeps case-insensitive matches for the rest."""
+        from recall.app.notifications import AppWhitelist
+
+        whitelist = AppWhitelist(["Zoom", "ZOOM"])
+        whitelist.discard("Zoom")
+
+        assert whitelist.contains_casefolded("zoom") is True
+        assert whitelist == {"ZOOM"}
+
+        whitelist.discard_casefolded("zoom")
+
+        assert whitelist.contains_casefolded("zoom") is False
+        assert len(whitelist) == 0
+
+    def test_config_from_dict_default_whitelist(self):
+        """Test that a missing or null whitelist falls back to the defaults."""
+        from recall.app.notifications import DEFAULT_MEETING_APPS, AutoRecordingConfig
+
+        missing = AutoRecordingConfig.from_dict({})
+        null = AutoRecordingConfig.from_dict({"app_whitelist": None})
+        empty = AutoRecordingConfig.from_dict({"app_whitelist": []})
+
+        assert missing.app_whitelist == null.app_whitelist == DEFAULT_MEETING_APPS
+        assert missing.app_whitelist is not null.app_whitelist
+        assert empty.app_whitelist == set()
+
     def test_config_to_dict(self):
         """Test converting config to dictionary."""
         from recall.app.notifications import AutoRecordingConfig
@@ -293,6 +432,29 @@ class TestAutoRecordingConfig:
         assert data["enabled"] is True
         assert "app_whitelist" in data
 
+    def test_config_accepts_list_whitelist(self):
+        """Test that a whitelist passed as a list is stored as a set."""
+        from recall.app.notifications import AutoRecordingConfig
+
+        config = AutoRecordingConfig(app_whitelist=["Zoom", "Arc"])
+        config.add_to_whitelist("Slack")
+
+        assert config.app_whitelist == {"Zoom", "Arc", "Slack"}
+        restored = AutoRecordingConfig.from_dict(config.to_dict())
+        assert restored.app_whitelist == config.app_whitelist
+
+    def test_config_whitelist_round_trip(self):
+        """Test that the whitelist is stored as a set and serialized sorted."""
+        import json
+
+        from recall.app.notifications import AutoRecordingConfig
+
+        config = AutoRecordingConfig.from_dict({"app_whitelist": ["Zoom", "Arc", "Zoom"]})
+        config.remove_from_whitelist("Missing")
+
+        assert config.app_whitelist == {"Arc", "Zoom"}
+        assert json.loads(json.dumps(config.to_dict()))["app_whitelist"] == ["Arc", "Zoom"]
+
 
 # ============================================================================
 # Test: AutoRecordingTrigger
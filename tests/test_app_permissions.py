@@ -89,6 +89,19 @@ class TestPermissionInfo:
 
         assert info.instructions == "Go to System Preferences..."
 
+    def test_permission_info_is_frozen(self):
+        """Test that PermissionInfo instances are immutable."""
+        import dataclasses
+
+        import pytest
+
+        from recall.app.permissions import PermissionManager, PermissionStatus
+
+        info = PermissionManager.PERMISSIONS[0]
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            info.status = PermissionStatus.GRANTED
+
 
 # ============================================================================
 # Test: PermissionManager
@@ -119,6 +132,18 @@ class TestPermissionManager:
         assert "accessibility" in perm_types
         assert "screen_recording" in perm_types
 
+    def test_get_all_permissions_copies_definitions(self):
+        """Test that current statuses don't leak into the shared definitions."""
+        from recall.app.permissions import PermissionManager, PermissionStatus
+
+        manager = PermissionManager()
+        with patch.object(manager, "check_permission", return_value=PermissionStatus.GRANTED):
+            permissions = manager.get_all_permissions()
+
+        assert all(p.status == PermissionStatus.GRANTED for p in permissions)
+        assert all(p.status == PermissionStatus.NOT_DETERMINED for p in manager.PERMISSIONS)
+        assert permissions[0].description == manager.PERMISSIONS[0].description
+
     def test_check_microphone_permission_on_non_macos(self):
         """Test microphone permission check returns NOT_DETERMINED on non-macOS."""
         from recall.app.permissions import PermissionManager, PermissionStatus, PermissionType
@@ -171,6 +196,100 @@ class TestPermissionManager:
             # On non-macOS, not all permissions granted
             assert manager.all_permissions_granted() is False
 
+    def test_check_permission_is_cached(self):
+        """Test that permission probes are reused within the cache TTL."""
+        from recall.app.permissions import PermissionManager, PermissionStatus, PermissionType
+
+        with patch("recall.app.permissions.MACOS_AVAILABLE", True):
+            manager = PermissionManager()
+            with patch.object(
+                manager, "_check_microphone_permission", return_value=PermissionStatus.GRANTED
+            ) as mock_check:
+                assert manager.check_permission(PermissionType.MICROPHONE) is (
+                    PermissionStatus.GRANTED
+                )
+                manager.check_permission(PermissionType.MICROPHONE)
+                assert mock_check.call_count == 1
+
+                manager.invalidate_cache()
+                manager.check_permission(PermissionType.MICROPHONE)
+                assert mock_check.call_count == 2
+
+    def test_check_microphone_permission_maps_status(self):
+        """Test that the AVFoundation authorization status is mapped to our enum."""
+        from unittest.mock import MagicMock
+
+        from recall.app.permissions import PermissionManager, PermissionStatus
+
+        av = MagicMock()
+        av.AVCaptureDevice.authorizationStatusForMediaType_.return_value = 3
+
+        with (
+            patch("recall.app.permissions.AVFOUNDATION_AVAILABLE", True),
+            patch("recall.app.permissions._AVFoundation", av),
+        ):
+            status = PermissionManager()._check_microphone_permission()
+
+        assert status == PermissionStatus.GRANTED
+        av.AVCaptureDevice.authorizationStatusForMediaType_.assert_called_once_with(
+            av.AVMediaTypeAudio
+        )
+
+    def test_check_accessibility_permission_without_quartz(self):
+        """Test accessibility check when Quartz could not be imported."""
+        from recall.app.permissions import PermissionManager, PermissionStatus
+
+        with patch("recall.app.permissions._Quartz", None):
+            status = PermissionManager()._check_accessibility_permission()
+
+        assert status == PermissionStatus.NOT_DETERMINED
+
+    def test_check_screen_recording_permission_uses_preflight(self):
+        """Test that the screen recording check avoids capturing the display."""
+        from unittest.mock import MagicMock
+
+        from recall.app.permissions import PermissionManager, PermissionStatus
+
+        quartz = MagicMock()
+        quartz.CGPreflightScreenCaptureAccess.return_value = False
+
+        with patch("recall.app.permissions._Quartz", quartz):
+            status = PermissionManager()._check_screen_recording_permission()
+
+        assert status == PermissionStatus.DENIED
+        quartz.CGDisplayCreateImage.assert_not_called()
+
+    def test_check_screen_recording_permission_legacy_fallback(self):
+        """Test the display capture fallback when preflight is unavailable."""
+        from unittest.mock import MagicMock
+
+        from recall.app.permissions import PermissionManager, PermissionStatus
+
+        quartz = MagicMock(spec=["CGMainDisplayID", "CGDisplayCreateImage"])
+
+        with patch("recall.app.permissions._Quartz", quartz):
+            status = PermissionManager()._check_screen_recording_permission()
+
+        assert status == PermissionStatus.GRANTED
+        quartz.CGDisplayCreateImage.assert_called_once()
+
+    def test_check_permission_cache_expires(self):
+        """Test that permissions are probed again once the TTL has passed."""
+        from recall.app.permissions import PermissionManager, PermissionStatus, PermissionType
+
+        with patch("recall.app.permissions.MACOS_AVAILABLE", True):
+            manager = PermissionManager()
+            with (
+                patch.object(
+                    manager, "_check_accessibility_permission", return_value=PermissionStatus.DENIED
+                ) as mock_check,
+                patch("recall.app.permissions.time.monotonic", side_effect=[100.0, 103.0]),
+            ):
+                manager.check_permission(PermissionType.ACCESSIBILITY)
+                manager.check_permission(PermissionType.ACCESSIBILITY)
+
+            assert mock_check.call_count == 2
+
 
 # ============================================================================
 # Test: Permission Request
@@ -191,6 +310,26 @@ class TestPermissionRequest:
             result = manager.request_permission(PermissionType.MICROPHONE)
             assert result is not None
 
+    def test_request_screen_recording_permission(self):
+        """Test requesting screen recording uses the capture access prompt."""
+        from unittest.mock import MagicMock
+
+        from recall.app.permissions import PermissionManager, PermissionStatus, PermissionType
+
+        quartz = MagicMock()
+        quartz.CGRequestScreenCaptureAccess.return_value = True
+
+        with (
+            patch("recall.app.permissions.MACOS_AVAILABLE", True),
+            patch("recall.app.permissions._Quartz", quartz),
+        ):
+            manager = PermissionManager()
+            with patch.object(manager, "open_system_preferences") as mock_open:
+                result = manager.request_permission(PermissionType.SCREEN_RECORDING)
+
+        assert result == PermissionStatus.GRANTED
+        mock_open.assert_not_called()
+
     def test_open_system_preferences_accessibility(self):
         """Test opening System Preferences for accessibility."""
         from recall.app.permissions import PermissionManager, PermissionType
@@ -212,6 +351,40 @@ class TestPermissionRequest:
             result = manager.open_system_preferences(PermissionType.MICROPHONE)
             assert result is False
 
+    def test_open_system_preferences_does_not_wait(self):
+        """Test that System Preferences is launched without waiting on `open`."""
+        from recall.app.permissions import (
+            PermissionManager,
+            PermissionType,
+            get_preferences_url,
+        )
+
+        with (
+            patch("recall.app.permissions.MACOS_AVAILABLE", True),
+            patch("recall.app.permissions.subprocess.Popen") as mock_popen,
+            patch("recall.app.permissions.subprocess.run") as mock_run,
+        ):
+            result = PermissionManager().open_system_preferences(PermissionType.MICROPHONE)
+
+        assert result is True
+        assert mock_popen.call_args.args[0] == [
+            "open",
+            get_preferences_url(PermissionType.MICROPHONE),
+        ]
+        mock_run.assert_not_called()
+
+    def test_open_system_preferences_launch_failure(self):
+        """Test that a failure to launch `open` returns False."""
+        from recall.app.permissions import PermissionManager, PermissionType
+
+        with (
+            patch("recall.app.permissions.MACOS_AVAILABLE", True),
+            patch("recall.app.permissions.subprocess.Popen", side_effect=OSError),
+        ):
+            result = PermissionManager().open_system_preferences(PermissionType.ACCESSIBILITY)
+
+        assert result is False
+
 
 # ============================================================================
 # Test: Permission Instructions
@@ -316,6 +489,31 @@ class TestPermissionCallback:
 
         assert len(manager._callbacks) == 0
 
+    def test_remove_unknown_callback(self):
+        """Test removing a callback that was never added."""
+        from recall.app.permissions import PermissionManager
+
+        manager = PermissionManager()
+        manager.remove_callback(lambda perm_type, status: None)
+
+        assert manager._callbacks == []
+
+    def test_notify_callbacks(self):
+        """Test that callbacks are notified and failing callbacks are ignored."""
+        from recall.app.permissions import PermissionManager, PermissionStatus, PermissionType
+
+        manager = PermissionManager()
+        calls = []
+
+        def failing(perm_type, status):
+            raise RuntimeError("boom")
+
+        manager.add_callback(failing)
+        manager.add_callback(lambda perm_type, status: calls.append((perm_type, status)))
+        manager._notify_callbacks(PermissionType.MICROPHONE, PermissionStatus.GRANTED)
+
+        assert calls == [(PermissionType.MICROPHONE, PermissionStatus.GRANTED)]
+
 
 # ============================================================================
 # Test: Permission Summary
@@ -347,6 +545,43 @@ class TestPermissionSummary:
             # Should be a multi-line string or dict
             assert len(summary) > 50  # Reasonable length
 
+    def test_permission_summary_checks_each_permission_once(self):
+        """Test that the summary probes every permission a single time."""
+        from recall.app.permissions import PermissionManager, PermissionStatus
+
+        manager = PermissionManager()
+        with patch.object(
+            manager, "check_permission", return_value=PermissionStatus.DENIED
+        ) as mock_check:
+            summary = manager.get_permission_summary()
+
+        assert mock_check.call_count == len(manager.PERMISSIONS)
+        assert "Missing 2 required permission(s): microphone, accessibility" in summary
+
+    def test_permission_summary_lines(self):
+        """Test the status icon and required label on each summary line."""
+        from recall.app.permissions import PermissionManager, PermissionStatus
+
+        manager = PermissionManager()
+        with patch.object(manager, "check_permission", return_value=PermissionStatus.GRANTED):
+            lines = manager.get_permission_summary().splitlines()
+
+        assert "✓ microphone: granted (required)" in lines
+        assert "✓ screen_recording: granted (optional)" in lines
+        assert lines[-1] == "All required permissions granted."
+
+    def test_all_permissions_granted_short_circuits(self):
+        """Test that the granted check stops at the first missing permission."""
+        from recall.app.permissions import PermissionManager, PermissionStatus
+
+        manager = PermissionManager()
+        with patch.object(
+            manager, "check_permission", return_value=PermissionStatus.DENIED
+        ) as mock_check:
+            assert manager.all_permissions_granted() is False
+
+        assert mock_check.call_count == 1
+
 
 # ============================================================================
 # Test: Required vs Optional Permissions
@@ -136,9 +136,10 @@ class TestRecordingControllerStart:
         with patch("recall.app.recording.Recorder"):
             controller = RecordingController()
 
+            before = time.time()
             controller.start_recording()
 
-            assert controller.recording_start_time is not None
+            assert before <= controller.recording_start_time <= time.time()
 
     def test_start_recording_returns_status(self):
         """Test that start_recording returns RecordingStatus."""
@@ -244,7 +245,7 @@ class TestRecordingControllerDuration:
         with patch("recall.app.recording.Recorder"):
             controller = RecordingController()
             controller.start_recording()
-            controller._recording_start_time = time.time() - 65  # 1:05
+            controller._recording_start_ns = time.monotonic_ns() - 65 * 10**9  # 1:05
 
             formatted = controller.get_formatted_duration()
 
@@ -20,6 +20,17 @@ from recall.capture.detector import (
     is_meeting_app_running,
 )
 
+
+@pytest.fixture(autouse=True)
+def clear_detector_cache():
+    """Ensure each test scans the (mocked) process list afresh."""
+    from recall.capture import detector
+
+    detector._clear_cache()
+    yield
+    detector._clear_cache()
+
+
 # ============================================================================
 # Test: AudioApp Model
 # ============================================================================
@@ -247,55 +258,96 @@ class TestGetRunningAudioApps:
 # ============================================================================
 
 
+class TestRunningAudioAppsCache:
+    """Tests for caching of the process scan."""
+
+    def test_scan_is_reused_within_ttl(self):
+        """Test that repeated calls share one process scan."""
+        with patch("recall.capture.detector.psutil") as mock_psutil:
+            mock_process = MagicMock()
+            mock_process.info = {"pid": 1234, "name": "zoom.us"}
+            mock_psutil.process_iter.return_value = [mock_process]
+
+            first = get_running_audio_apps()
+            first.clear()
+            second = get_running_audio_apps()
+
+            assert mock_psutil.process_iter.call_count == 1
+            assert [app.name for app in second] == ["Zoom"]
+
+    def test_scan_repeats_after_ttl(self):
+        """Test that the process list is scanned again once the cache expires."""
+        with (
+            patch("recall.capture.detector.psutil") as mock_psutil,
+            patch("recall.capture.detector.time.monotonic", side_effect=[100.0, 103.0]),
+        ):
+            mock_psutil.process_iter.return_value = []
+
+            get_running_audio_apps()
+            get_running_audio_apps()
+
+            assert mock_psutil.process_iter.call_count == 2
+
+
 class TestIsMeetingAppRunning:
     """Tests for is_meeting_app_running helper function."""
 
+    @staticmethod
+    def _processes(*names):
+        """Build mock psutil processes with the given names."""
+        processes = []
+        for pid, name in enumerate(names, start=100):
+            process = MagicMock()
+            process.info = {"pid": pid, "name": name}
+            processes.append(process)
+        return processes
+
     def test_returns_true_when_zoom_running(self):
         """Test that returns True when Zoom is running."""
-        with patch("recall.capture.detector.get_running_audio_apps") as mock_get:
-            mock_get.return_value = [
-                AudioApp(
-                    name="Zoom",
-                    process_name="zoom.us",
-                    category=AudioAppCategory.MEETING,
-                )
-            ]
+        with patch("recall.capture.detector.psutil") as mock_psutil:
+            mock_psutil.process_iter.return_value = self._processes("Finder", "zoom.us")
 
             assert is_meeting_app_running()
 
     def test_returns_true_when_teams_running(self):
         """Test that returns True when Teams is running."""
-        with patch("recall.capture.detector.get_running_audio_apps") as mock_get:
-            mock_get.return_value = [
-                AudioApp(
-                    name="Microsoft Teams",
-                    process_name="Microsoft Teams",
-                    category=AudioAppCategory.MEETING,
-                )
-            ]
+        with patch("recall.capture.detector.psutil") as mock_psutil:
+            mock_psutil.process_iter.return_value = self._processes("Microsoft Teams")
 
             assert is_meeting_app_running()
 
     def test_returns_false_when_no_meeting_app(self):
         """Test that returns False when no meeting app is running."""
-        with patch("recall.capture.detector.get_running_audio_apps") as mock_get:
-            mock_get.return_value = [
-                AudioApp(
-                    name="Spotify",
-                    process_name="Spotify",
-                    category=AudioAppCategory.MEDIA,
-                )
-            ]
+        with patch("recall.capture.detector.psutil") as mock_psutil:
+            mock_psutil.process_iter.return_value = self._processes("Spotify", "Safari")
 
             assert not is_meeting_app_running()
 
     def test_returns_false_when_no_apps(self):
         """Test that returns False when no audio apps are running."""
-        with patch("recall.capture.detector.get_running_audio_apps") as mock_get:
-            mock_get.return_value = []
+        with patch("recall.capture.detector.psutil") as mock_psutil:
+            mock_psutil.process_iter.return_value = []
 
             assert not is_meeting_app_running()
 
+    def test_stops_at_first_meeting_app(self):
+        """Test that the scan stops as soon as a meeting app is found."""
+        with patch("recall.capture.detector.psutil") as mock_psutil:
+            processes = self._processes("zoom.us", "Spotify")
+            mock_psutil.process_iter.return_value = iter(processes)
+
+            assert is_meeting_app_running()
+            assert next(mock_psutil.process_iter.return_value) is processes[1]
+
+    def test_uses_recent_scan(self):
+        """Test that a cached scan is reused instead of listing processes."""
+        with patch("recall.capture.detector.psutil") as mock_psutil:
+            mock_psutil.process_iter.return_value = self._processes("Discord")
+            get_running_audio_apps()
+
+            assert is_meeting_app_running()
+            assert mock_psutil.process_iter.call_count == 1
+
 
 # ============================================================================
 # Test: get_active_audio_app
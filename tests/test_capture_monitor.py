@@ -20,6 +20,17 @@ from recall.capture.monitor import (
     is_blackhole_available,
 )
 
+
+@pytest.fixture(autouse=True)
+def clear_device_cache():
+    """Ensure each test queries the (mocked) device list afresh."""
+    from recall.capture import devices
+
+    devices.clear_device_cache()
+    yield
+    devices.clear_device_cache()
+
+
 # ============================================================================
 # Test: AudioEvent Model
 # ============================================================================
@@ -126,6 +137,71 @@ class TestAudioMonitorStartStop:
             # For unit test, we test the state change
             assert not monitor.is_monitoring
 
+    def test_start_monitoring_opens_stream(self):
+        """Test that start_monitoring opens the BlackHole stream with a fixed blocksize."""
+        from recall.capture.monitor import MONITOR_BLOCK_FRAMES
+
+        with (
+            patch("recall.capture.monitor.sd") as mock_sd,
+            patch("recall.capture.devices.sd") as mock_devices_sd,
+        ):
+            mock_devices_sd.query_devices.return_value = [
+                {"name": "BlackHole 2ch", "max_input_channels": 2, "index": 3}
+            ]
+
+            monitor = AudioMonitor()
+            monitor.start_monitoring(MagicMock())
+
+            assert monitor.is_monitoring
+            kwargs = mock_sd.InputStream.call_args.kwargs
+            assert kwargs["device"] == 3
+            assert kwargs["channels"] == 1
+            assert kwargs["samplerate"] == 16000
+            assert kwargs["blocksize"] == MONITOR_BLOCK_FRAMES
+            mock_sd.InputStream.return_value.start.assert_called_once()
+
+            monitor.stop_monitoring()
+
+    def test_start_monitoring_uses_device_rate_if_16khz_unsupported(self):
+        """Test that the device default rate is used when 16 kHz is rejected."""
+        with (
+            patch("recall.capture.monitor.sd") as mock_sd,
+            patch("recall.capture.devices.sd") as mock_devices_sd,
+        ):
+            mock_devices_sd.query_devices.return_value = [
+                {"name": "BlackHole 2ch", "max_input_channels": 2, "index": 0}
+            ]
+            mock_sd.check_input_settings.side_effect = ValueError("Invalid sample rate")
+
+            monitor = AudioMonitor()
+            monitor.start_monitoring(MagicMock())
+
+            mock_sd.check_input_settings.assert_called_once_with(device=0, samplerate=16000)
+            assert mock_sd.InputStream.call_args.kwargs["samplerate"] is None
+
+    def test_start_monitoring_falls_back_to_stereo(self):
+        """Test that a device refusing mono input is opened in stereo."""
+
+        class FakePortAudioError(Exception):
+            pass
+
+        with (
+            patch("recall.capture.monitor.sd") as mock_sd,
+            patch("recall.capture.devices.sd") as mock_devices_sd,
+        ):
+            mock_devices_sd.query_devices.return_value = [
+                {"name": "BlackHole 2ch", "max_input_channels": 2, "index": 0}
+            ]
+            mock_sd.PortAudioError = FakePortAudioError
+            stereo_stream = MagicMock()
+            mock_sd.InputStream.side_effect = [FakePortAudioError("channels"), stereo_stream]
+
+            monitor = AudioMonitor()
+            monitor.start_monitoring(MagicMock())
+
+            assert mock_sd.InputStream.call_args.kwargs["channels"] == 2
+            stereo_stream.start.assert_called_once()
+
     def test_stop_monitoring_sets_is_monitoring_false(self):
         """Test that stop_monitoring sets is_monitoring to False."""
         monitor = AudioMonitor()
@@ -212,6 +288,23 @@ class TestAudioDetection:
         # Depends on threshold, but spike alone shouldn't trigger
         assert not is_audio
 
+    def test_detect_audio_updates_amplitude(self):
+        """Test that stereo float32 blocks report their RMS amplitude."""
+        monitor = AudioMonitor(silence_threshold=0.01)
+
+        audio_data = np.full((2048, 2), 0.02, dtype=np.float32)
+        audio_data[:, 1] = -0.02
+
+        assert monitor._is_audio_present(audio_data)
+        assert monitor.current_amplitude == pytest.approx(0.02)
+
+    def test_detect_audio_empty_block_is_silence(self):
+        """Test that an empty block is treated as silence."""
+        monitor = AudioMonitor(silence_threshold=0.01)
+
+        assert not monitor._is_audio_present(np.zeros((0, 2), dtype=np.float32))
+        assert monitor.current_amplitude == 0.0
+
 
 # ============================================================================
 # Test: Audio State Transitions
@@ -242,12 +335,12 @@ class TestAudioStateTransitions:
         monitor._emit_event = lambda e: events.append(e)
 
         # Simulate audio then silence
+        import time
+
         monitor._was_audio_present = True
-        monitor._silence_start = datetime.now()
+        monitor._silence_start = time.monotonic()
 
         # Wait for silence duration to pass
-        import time
-
         time.sleep(0.15)
 
         monitor._process_audio_state(is_audio=False)
@@ -263,8 +356,10 @@ class TestAudioStateTransitions:
         monitor._emit_event = lambda e: events.append(e)
 
         # Simulate audio then brief silence
+        import time
+
         monitor._was_audio_present = True
-        monitor._silence_start = datetime.now()
+        monitor._silence_start = time.monotonic()
 
         # Don't wait for full silence duration
         monitor._process_audio_state(is_audio=False)
@@ -272,6 +367,24 @@ class TestAudioStateTransitions:
         # Should not emit stopped event yet
         assert len(events) == 0
 
+    def test_silence_timing_uses_monotonic_clock(self):
+        """Test that silence is timed with the monotonic clock."""
+        events = []
+        monitor = AudioMonitor(silence_threshold=0.01, silence_duration=2.0)
+        monitor._emit_event = lambda e: events.append(e)
+        monitor._was_audio_present = True
+
+        with patch("recall.capture.monitor.time.monotonic", side_effect=[50.0, 51.0, 52.5]):
+            monitor._process_audio_state(is_audio=False)
+            monitor._process_audio_state(is_audio=False)
+            assert events == []
+
+            monitor._process_audio_state(is_audio=False)
+
+        assert [e.event_type for e in events] == ["stopped"]
+        assert isinstance(events[0].timestamp, datetime)
+        assert monitor._silence_start is None
+
 
 # ============================================================================
 # Test: BlackHole Detection
@@ -283,7 +396,7 @@ class TestBlackHoleDetection:
 
     def test_is_blackhole_available_true_when_present(self):
         """Test that is_blackhole_available returns True when BlackHole is installed."""
-        with patch("recall.capture.monitor.sd") as mock_sd:
+        with patch("recall.capture.devices.sd") as mock_sd:
             mock_sd.query_devices.return_value = [
                 {"name": "MacBook Pro Microphone", "max_input_channels": 1},
                 {"name": "BlackHole 2ch", "max_input_channels": 2},
@@ -293,7 +406,7 @@ class TestBlackHoleDetection:
 
     def test_is_blackhole_available_false_when_absent(self):
         """Test that is_blackhole_available returns False when BlackHole not installed."""
-        with patch("recall.capture.monitor.sd") as mock_sd:
+        with patch("recall.capture.devices.sd") as mock_sd:
             mock_sd.query_devices.return_value = [
                 {"name": "MacBook Pro Microphone", "max_input_channels": 1},
                 {"name": "Built-in Output", "max_input_channels": 0},
@@ -303,7 +416,7 @@ class TestBlackHoleDetection:
 
     def test_is_blackhole_available_handles_error(self):
         """Test that is_blackhole_available handles sounddevice errors."""
-        with patch("recall.capture.monitor.sd") as mock_sd:
+        with patch("recall.capture.devices.sd") as mock_sd:
             mock_sd.query_devices.side_effect = Exception("No audio devices")
 
             # Should return False, not raise
@@ -311,7 +424,7 @@ class TestBlackHoleDetection:
 
     def test_monitor_finds_blackhole_device(self):
         """Test that AudioMonitor finds BlackHole device by name."""
-        with patch("recall.capture.monitor.sd") as mock_sd:
+        with patch("recall.capture.devices.sd") as mock_sd:
             mock_sd.query_devices.return_value = [
                 {"name": "MacBook Pro Microphone", "max_input_channels": 1, "index": 0},
                 {"name": "BlackHole 2ch", "max_input_channels": 2, "index": 1},
@@ -323,6 +436,36 @@ class TestBlackHoleDetection:
             assert device_id == 1
 
 
+class TestDeviceCache:
+    """Tests for the shared audio device list."""
+
+    def test_device_list_is_reused(self):
+        """Test that repeated device lookups share one PortAudio query."""
+        with patch("recall.capture.devices.sd") as mock_sd:
+            mock_sd.query_devices.return_value = [
+                {"name": "BlackHole 2ch", "max_input_channels": 2, "index": 0}
+            ]
+
+            assert is_blackhole_available()
+            assert AudioMonitor()._find_device() == 0
+            assert mock_sd.query_devices.call_count == 1
+
+    def test_clear_device_cache(self):
+        """Test that clearing the cache picks up newly added devices."""
+        from recall.capture.devices import clear_device_cache
+
+        with patch("recall.capture.devices.sd") as mock_sd:
+            mock_sd.query_devices.return_value = []
+            assert not is_blackhole_available()
+
+            mock_sd.query_devices.return_value = [
+                {"name": "BlackHole 2ch", "max_input_channels": 2, "index": 0}
+            ]
+            clear_device_cache()
+
+            assert is_blackhole_available()
+
+
 # ============================================================================
 # Test: Monitor Properties
 # ============================================================================
@@ -121,6 +121,150 @@ class TestRecordingWorkflow:
         timestamp_part = audio_path.stem.replace("mic_", "")
         assert len(timestamp_part) == 15  # YYYYMMDD_HHMMSS
 
+    def test_recording_streams_audio_to_wav(self, temp_storage_dir, mock_sounddevice):
+        """Test that every captured block ends up in the WAV file, in order."""
+        import wave
+
+        import numpy as np
+
+        from recall.capture.recorder import Recorder
+
+        mock_sounddevice.input_blocks += [
+            np.full((2048, 1), 0.25, dtype=np.float32),
+            np.full((512, 1), -0.5, dtype=np.float32),
+        ]
+
+        recorder = Recorder(output_dir=temp_storage_dir)
+        recorder.start_recording()
+        audio_path = recorder.stop_recording()
+
+        with wave.open(str(audio_path), "rb") as wav:
+            assert wav.getnframes() == 1024 + 2048 + 512
+            samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+
+        # 1024 silent frames from the fixture, then the two blocks above
+        assert samples[1024] == round(0.25 * 32767)
+        assert samples[-1] == -16384  # -16383.5 rounds to even
+
+    def test_recording_reads_stream_without_callback(self, temp_storage_dir, mock_sounddevice):
+        """Test that audio is pulled by a reader thread, not a PortAudio callback."""
+        from recall.capture.recorder import STREAM_BLOCK_FRAMES, Recorder
+
+        recorder = Recorder(output_dir=temp_storage_dir)
+        recorder.start_recording()
+        recorder.stop_recording()
+
+        kwargs = mock_sounddevice.InputStream.call_args.kwargs
+        assert "callback" not in kwargs
+        assert kwargs["blocksize"] == STREAM_BLOCK_FRAMES
+        # Only the frames already waiting are read, so reads never block
+        mock_sounddevice.InputStream.return_value.read.assert_called_once_with(1024)
+
+    def test_stop_drains_before_stopping_stream(self, temp_storage_dir, mock_sounddevice):
+        """Test that audio still waiting in the stream is written before it stops."""
+        import wave
+
+        import numpy as np
+
+        from recall.capture.recorder import Recorder
+
+        stream = mock_sounddevice.InputStream.return_value
+        stream.stop.side_effect = lambda: mock_sounddevice.input_blocks.clear()
+
+        recorder = Recorder(output_dir=temp_storage_dir)
+        recorder.start_recording()
+        # Arrives just before the stop request
+        mock_sounddevice.input_blocks.append(np.zeros((512, 1), dtype=np.float32))
+        audio_path = recorder.stop_recording()
+
+        with wave.open(str(audio_path), "rb") as wav:
+            assert wav.getnframes() == 1024 + 512
+
+    def test_empty_reads_are_skipped(self, temp_storage_dir, mock_sounddevice):
+        """Test that reads returning no frames don't break the recording."""
+        import wave
+
+        import numpy as np
+
+        from recall.capture.recorder import Recorder
+
+        mock_sounddevice.input_blocks.insert(0, np.zeros((0, 1), dtype=np.float32))
+
+        recorder = Recorder(output_dir=temp_storage_dir)
+        recorder.start_recording()
+        audio_path = recorder.stop_recording()
+
+        with wave.open(str(audio_path), "rb") as wav:
+            assert wav.getnframes() == 1024
+
+    def test_read_error_raises_on_stop(self, temp_storage_dir, mock_sounddevice):
+        """Test that a failure while reading audio is reported by stop_recording."""
+        from recall.capture.recorder import Recorder, RecordingError
+
+        mock_sounddevice.InputStream.return_value.read.side_effect = RuntimeError("unplugged")
+
+        recorder = Recorder(output_dir=temp_storage_dir)
+        recorder.start_recording()
+        # The failed read ends the reader thread while still recording
+        recorder._reader_thread.join(timeout=1)
+
+        with pytest.raises(RecordingError, match="unplugged"):
+            recorder.stop_recording()
+
+        assert recorder.is_recording is False
+
+    def test_stop_gives_up_on_stuck_reader(
+        self, temp_storage_dir, mock_sounddevice, monkeypatch, caplog
+    ):
+        """Test that stop_recording doesn't hang or close the file under a stuck reader."""
+        import threading
+
+        import numpy as np
+
+        from recall.capture import recorder as recorder_module
+        from recall.capture.recorder import Recorder, RecordingError
+
+        monkeypatch.setattr(recorder_module, "READER_JOIN_TIMEOUT", 0.01)
+        release = threading.Event()
+        reading = threading.Event()
+
+        def stuck_read(frames):
+            reading.set()
+            release.wait(timeout=5)
+            return np.zeros((frames, 1), dtype=np.float32), False
+
+        stream = mock_sounddevice.InputStream.return_value
+        stream.read.side_effect = stuck_read
+
+        recorder = Recorder(output_dir=temp_storage_dir)
+        recorder.start_recording()
+        assert reading.wait(timeout=1)
+        reader = recorder._reader_thread
+
+        with caplog.at_level("WARNING", logger="recall.capture.recorder"):
+            with pytest.raises(RecordingError, match="did not stop"):
+                recorder.stop_recording()
+
+        assert "still running" in caplog.text
+        stream.close.assert_not_called()
+
+        release.set()
+        reader.join(timeout=1)
+        assert recorder._reader_error is None
+
+    def test_failed_stream_start_removes_wav(self, temp_storage_dir, mock_sounddevice):
+        """Test that no partial WAV file is left when the stream can't open."""
+        from recall.capture.recorder import Recorder
+
+        mock_sounddevice.InputStream.side_effect = RuntimeError("no device")
+        recorder = Recorder(output_dir=temp_storage_dir)
+
+        with pytest.raises(RuntimeError):
+            recorder.start_recording()
+
+        assert recorder.is_recording is False
+        assert list(temp_storage_dir.glob("*.wav")) == []
+
     def test_stop_without_start_raises_error(self, temp_storage_dir):
         """Test that stop_recording without start raises error."""
         from recall.capture.recorder import Recorder, RecordingError
@@ -245,6 +389,27 @@ class TestWAVFileFormat:
         with wave.open(str(audio_path), "rb") as wav:
             assert wav.getnchannels() == 1
 
+    def test_wav_samples_are_clipped(self, temp_storage_dir, mock_sounddevice):
+        """Test that out-of-range samples saturate instead of wrapping around."""
+        import wave
+
+        import numpy as np
+
+        from recall.capture.recorder import WAV_WRITE_BLOCK_FRAMES, Recorder
+
+        audio = np.zeros((WAV_WRITE_BLOCK_FRAMES + 3, 1), dtype=np.float32)
+        audio[-3:, 0] = [1.5, -2.0, 0.5]
+        mock_sounddevice.rec.return_value = audio
+
+        recorder = Recorder(output_dir=temp_storage_dir)
+        audio_path = recorder.record(duration_seconds=1)
+
+        with wave.open(str(audio_path), "rb") as wav:
+            assert wav.getnframes() == len(audio)
+            samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+
+        assert samples[-3:].tolist() == [32767, -32767, 16384]
+
     def test_wav_file_is_16bit(self, temp_storage_dir, mock_sounddevice):
         """Test that WAV file has 16-bit sample width."""
         import wave
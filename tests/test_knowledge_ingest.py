@@ -252,6 +252,21 @@ class TestDuplicatePrevention:
         # Second call should not add more inserts
         assert call_count_2 == call_count_1
 
+    def test_ingest_state_round_trips_from_indented_file(self, mock_graphrag, tmp_path):
+        """Test that state files written indented by earlier versions still load and re-save."""
+        import json
+
+        from recall.knowledge.ingest import KnowledgeIngestor
+
+        state_file = tmp_path / "state.json"
+        entry = {"filepath": "/test/rec-1.md", "timestamp": "2025-11-25T12:00:00", "chunks": 1}
+        state_file.write_text(json.dumps({"ingested": {"rec-1": entry}}, indent=2))
+
+        KnowledgeIngestor(mock_graphrag, state_file=state_file)._save_state()
+
+        assert "\n" not in state_file.read_text()
+        assert KnowledgeIngestor(mock_graphrag, state_file=state_file).is_ingested("rec-1")
+
 
 # ============================================================================
 # sync_knowledge_base Tests
@@ -90,6 +90,24 @@ class TestKnowledgeSyncInit:
         assert sync.last_sync is not None
         assert len(sync.file_hashes) == 1
 
+    def test_state_round_trips_from_indented_file(self, sync_state_file, mock_graphrag):
+        """Test that state files written indented by earlier versions still load and re-save."""
+        from recall.knowledge.sync import KnowledgeSync
+
+        state = {
+            "last_sync": "2025-11-25T12:00:00",
+            "file_hashes": {"/path/to/file.md": "abc123"},
+        }
+        sync_state_file.parent.mkdir(parents=True, exist_ok=True)
+        sync_state_file.write_text(json.dumps(state, indent=2))
+
+        KnowledgeSync(mock_graphrag, state_file=sync_state_file)._save_state()
+
+        assert "\n" not in sync_state_file.read_text()
+        reloaded = KnowledgeSync(mock_graphrag, state_file=sync_state_file)
+        assert reloaded.last_sync == datetime(2025, 11, 25, 12, 0, 0)
+        assert reloaded.file_hashes == state["file_hashes"]
+
 
 # ============================================================================
 # Change Detection Tests
@@ -101,6 +101,8 @@ class TestRecordingWorkflowE2E:
                 assert app.recording_duration is not None
                 assert app.recording_duration >= 0
 
+                # Hold the ingestion job so the PROCESSING state can be inspected
+                app._ingest_executor = MagicMock()
                 # Stop recording
                 app.on_stop_recording(None)
                 assert app.state == AppState.PROCESSING
@@ -121,6 +123,8 @@ class TestRecordingWorkflowE2E:
                 app.hotkey_manager._handle_toggle_recording()
                 assert app.state == AppState.RECORDING
 
+                # Hold the ingestion job so the PROCESSING state can be inspected
+                app._ingest_executor = MagicMock()
                 # Toggle OFF via hotkey
                 app.hotkey_manager._handle_toggle_recording()
                 assert app.state == AppState.PROCESSING
@@ -393,6 +397,8 @@ class TestFullUserScenario:
                 assert duration is not None
                 assert duration > 0
 
+                # Hold the ingestion job so the PROCESSING state can be inspected
+                app._ingest_executor = MagicMock()
                 # 6. User presses Cmd+Shift+R to stop
                 app.hotkey_manager._handle_toggle_recording()
                 assert app.state == AppState.PROCESSING